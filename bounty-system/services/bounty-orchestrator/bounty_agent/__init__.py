@@ -10,8 +10,18 @@ Key components:
 - MemoryManager: Long-term memory with semantic search
 """
 
-from .agent import BountyOrchestrator, graph, get_graph
-from .memory import MemoryManager, get_store
+import importlib
+
+# Exports resolved on first access (PEP 562), so importing one submodule
+# (e.g. bounty_agent.agent for deploy.py / Agent Engine unpickling) doesn't
+# pull in LangGraph, LangChain and the memory stack through this package.
+_LAZY_EXPORTS = {
+    "BountyOrchestrator": ".agent",
+    "get_graph": ".local_graph",
+    "graph": ".local_graph",
+    "MemoryManager": ".memory",
+    "get_store": ".memory",
+}
 
 __all__ = [
     "BountyOrchestrator",
@@ -20,3 +30,11 @@ __all__ = [
     "MemoryManager",
     "get_store",
 ]
+
+
+def __getattr__(name: str):
+    """Import exports lazily; ``graph`` is compiled only when accessed."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
@@ -5,8 +5,12 @@ Agent Engine serialization protocol:
 
 - __init__: Store ONLY primitives (runs locally, gets pickled)
 - set_up: Initialize clients and graph (runs remotely after unpickle)
-- query: Synchronous entry point for Agent Engine
-- stream_query: Streaming entry point for long operations
+- query / async_query: Entry points for Agent Engine
+- stream_query / async_stream_query: Streaming entry points for long operations
+
+The module-level compiled graph used by the FastAPI server and
+langgraph.json lives in local_graph.py, so importing this module never
+builds one.
 
 The separation is CRITICAL because cloudpickle cannot serialize:
 - gRPC channels (ChatVertexAI)
@@ -17,12 +21,79 @@ The separation is CRITICAL because cloudpickle cannot serialize:
 See: Phase 8.2.1 in deployment plan for serialization protocol.
 """
 
+import asyncio
+import atexit
+import functools
 import logging
 import os
+import threading
 from typing import Any, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# Background event loop shared by all orchestrators in this process.
+# The Postgres checkpointer and its pool are asyncio objects bound to the
+# loop that created them, so every graph call is submitted to this loop.
+_runtime_loop: Optional[asyncio.AbstractEventLoop] = None
+_runtime_lock = threading.Lock()
+
+
+def _get_runtime_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the background event loop for orchestrator work."""
+    global _runtime_loop
+    with _runtime_lock:
+        if _runtime_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="bounty-orchestrator-loop",
+                daemon=True,
+            ).start()
+            _runtime_loop = loop
+    return _runtime_loop
+
+
+# HTTP clients shared by all orchestrators in this process, keyed by base URL,
+# so TLS handshakes and keep-alive connections are reused across instances.
+_http_clients: Dict[str, Any] = {}
+
+
+def _get_http_client(base_url: str):
+    """Get or create the shared httpx.AsyncClient for a base URL."""
+    with _runtime_lock:
+        client = _http_clients.get(base_url)
+        if client is None:
+            import httpx
+
+            if not _http_clients:
+                atexit.register(_close_http_clients)
+            client = httpx.AsyncClient(
+                base_url=base_url,
+                timeout=120.0,
+                limits=httpx.Limits(max_keepalive_connections=50, keepalive_expiry=300),
+            )
+            _http_clients[base_url] = client
+    return client
+
+
+def _close_http_clients() -> None:
+    """Close the shared HTTP clients on the runtime loop at exit."""
+    clients = list(_http_clients.values())
+    _http_clients.clear()
+    loop = _runtime_loop
+    if loop is None or not loop.is_running():
+        return
+    for client in clients:
+        try:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=5)
+        except Exception:
+            logger.debug("Failed to close shared HTTP client", exc_info=True)
+
+
+async def _anext(stream):
+    """Coroutine wrapper so a stream step can be submitted to another loop."""
+    return await stream.__anext__()
+
 
 class BountyOrchestrator:
     """
@@ -73,13 +144,29 @@ class BountyOrchestrator:
         self.config = {
             "temperature": 0.1,
             "max_output_tokens": 8192,
-            "recursion_limit": 50,
+            "recursion_limit": DEFAULT_RECURSION_LIMIT,
         }
 
         # These will be initialized in set_up() AFTER unpickling
         self.graph = None
         self.checkpointer = None
         self.http_client = None
+        self._ready = None
+
+    # Attributes created by set_up(); never serialized
+    _RUNTIME_ATTRS = ("graph", "checkpointer", "http_client", "_ready")
+
+    def __getstate__(self):
+        """Pickle configuration only.
+
+        Clients, the compiled graph and the set-up future are reset to None
+        so the payload stays minimal even if set_up() already ran locally;
+        set_up() rebuilds them after unpickling.
+        """
+        state = self.__dict__.copy()
+        for name in self._RUNTIME_ATTRS:
+            state[name] = None
+        return state
 
     def set_up(self):
         """
@@ -88,77 +175,29 @@ class BountyOrchestrator:
         Initialize all clients and heavy objects here.
         This method is called automatically by Agent Engine runtime.
 
-        IMPORTANT: All imports that use network/gRPC should be inside
-        this method to ensure they're available in the remote environment.
+        The checkpointer and graph are built asynchronously on the runtime
+        event loop, so set_up returns without waiting on database I/O;
+        the query methods wait for that work before running the graph.
         """
-        # Import inside set_up to ensure availability in remote env
-        from langgraph.graph import StateGraph, END
-
-        from .state import BountyState
-        from .nodes import (
-            analyze_bounty,
-            check_competition,
-            should_proceed,
-            create_plan,
-            is_approved,
-            execute_via_bob,
-        )
-
         # 1. Set up Bob's Brain URL from env if not provided
         if not self.bobs_brain_url:
             self.bobs_brain_url = os.environ.get("BOBS_BRAIN_A2A_URL")
 
-        # 2. Initialize HTTP client for A2A communication
-        import httpx
-
-        self.http_client = httpx.AsyncClient(
-            base_url=self.bobs_brain_url or "",
-            timeout=120.0,
-        )
-
-        # 3. Initialize checkpointer (PostgreSQL for production)
-        self.checkpointer = self._get_checkpointer()
-
-        # 4. Build the LangGraph workflow
-        workflow = StateGraph(BountyState)
-
-        # Add nodes
-        workflow.add_node("analyze", analyze_bounty)
-        workflow.add_node("check_competition", check_competition)
-        workflow.add_node("create_plan", create_plan)
-        workflow.add_node("approval", lambda s: s)  # Human checkpoint
-        workflow.add_node("execute", execute_via_bob)
-
-        # Set entry point
-        workflow.set_entry_point("analyze")
-
-        # Wire edges
-        workflow.add_edge("analyze", "check_competition")
-
-        workflow.add_conditional_edges(
-            "check_competition",
-            should_proceed,
-            {
-                "continue": "create_plan",
-                "skip": END,
-            },
-        )
-
-        workflow.add_edge("create_plan", "approval")
+        # 2. Reuse the process-wide HTTP client for A2A communication
+        self.http_client = _get_http_client(self.bobs_brain_url or "")
 
-        workflow.add_conditional_edges(
-            "approval",
-            is_approved,
-            {
-                "execute": "execute",
-                "rejected": END,
-            },
+        # 3. Schedule checkpointer + graph construction on the runtime loop
+        self._ready = asyncio.run_coroutine_threadsafe(
+            self._aset_up(), _get_runtime_loop()
         )
 
-        workflow.add_edge("execute", END)
+    async def _aset_up(self):
+        """Initialize the checkpointer and compile the graph (runtime loop)."""
+        # 1. Initialize checkpointer (PostgreSQL for production)
+        self.checkpointer = await self._get_checkpointer()
 
-        # Compile with checkpointer
-        self.graph = workflow.compile(checkpointer=self.checkpointer)
+        # 2. Compile the shared workflow with this checkpointer
+        self.graph = make_workflow().compile(checkpointer=self.checkpointer)
 
         logger.info(
             "BountyOrchestrator initialized",
@@ -170,20 +209,26 @@ class BountyOrchestrator:
             },
         )
 
-    def _get_checkpointer(self):
+    async def _get_checkpointer(self):
         """Get the appropriate checkpointer based on environment.
 
-        Production uses PostgreSQL (L5 compliance).
+        Production uses PostgreSQL (L5 compliance) via AsyncPostgresSaver on
+        the shared connection pool; migrations run once here.
         Development uses in-memory for testing.
         """
         database_url = os.environ.get("DATABASE_URL")
 
         if database_url:
             # Production: Use PostgreSQL
-            from langgraph.checkpoint.postgres import PostgresSaver
+            from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+
+            from .db import get_pool, open_pool
 
             logger.info("Using PostgreSQL checkpointer for production")
-            return PostgresSaver.from_conn_string(database_url)
+            await open_pool()
+            checkpointer = AsyncPostgresSaver(get_pool())
+            await checkpointer.setup()
+            return checkpointer
         else:
             # Development: Use in-memory (testing only)
             from langgraph.checkpoint.memory import MemorySaver
@@ -193,6 +238,36 @@ class BountyOrchestrator:
             )
             return MemorySaver()
 
+    def _submit(self, coro):
+        """Schedule a coroutine on the runtime loop."""
+        if self._ready is None:
+            coro.close()
+            raise RuntimeError("Agent not initialized. Call set_up() first.")
+        return asyncio.run_coroutine_threadsafe(coro, _get_runtime_loop())
+
+    async def _ainvoke(self, input: str, config: Optional[Dict]) -> Dict[str, Any]:
+        """Run the graph to completion (runtime loop)."""
+        await asyncio.wrap_future(self._ready)
+
+        thread_id = config.get("thread_id", "default") if config else "default"
+
+        return await self.graph.ainvoke(
+            {"input": input},
+            config=make_config(thread_id, self.config["recursion_limit"]),
+        )
+
+    async def _astream(self, input: str, config: Optional[Dict]):
+        """Stream graph chunks (runtime loop)."""
+        await asyncio.wrap_future(self._ready)
+
+        thread_id = config.get("thread_id", "default") if config else "default"
+
+        async for chunk in self.graph.astream(
+            {"input": input},
+            config=make_config(thread_id, self.config["recursion_limit"]),
+        ):
+            yield chunk
+
     def query(self, input: str, config: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Synchronous entry point for Agent Engine.
@@ -206,18 +281,22 @@ class BountyOrchestrator:
         Returns:
             The graph execution result
         """
-        if self.graph is None:
-            raise RuntimeError("Agent not initialized. Call set_up() first.")
+        return self._submit(self._ainvoke(input, config)).result()
 
-        thread_id = config.get("thread_id", "default") if config else "default"
+    async def async_query(
+        self, input: str, config: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Async entry point for Agent Engine.
 
-        return self.graph.invoke(
-            {"input": input},
-            config={
-                "configurable": {"thread_id": thread_id},
-                "recursion_limit": self.config["recursion_limit"],
-            },
-        )
+        Args:
+            input: The user's input/query
+            config: Optional configuration including thread_id
+
+        Returns:
+            The graph execution result
+        """
+        return await asyncio.wrap_future(self._submit(self._ainvoke(input, config)))
 
     def stream_query(self, input: str, config: Optional[Dict] = None):
         """
@@ -229,51 +308,75 @@ class BountyOrchestrator:
             input: The user's input/query
             config: Optional configuration including thread_id
 
-        Yields:
-            Streaming chunks from the graph execution
+        Returns:
+            Iterator over streaming chunks from the graph execution
         """
-        if self.graph is None:
+        if self._ready is None:
             raise RuntimeError("Agent not initialized. Call set_up() first.")
 
-        thread_id = config.get("thread_id", "default") if config else "default"
+        stream = self._astream(input, config)
 
-        return self.graph.stream(
-            {"input": input},
-            config={
-                "configurable": {"thread_id": thread_id},
-                "recursion_limit": self.config["recursion_limit"],
-            },
-        )
+        def _iterate():
+            while True:
+                try:
+                    yield self._submit(_anext(stream)).result()
+                except StopAsyncIteration:
+                    return
+
+        return _iterate()
+
+    async def async_stream_query(self, input: str, config: Optional[Dict] = None):
+        """
+        Async streaming entry point for Agent Engine.
+
+        Args:
+            input: The user's input/query
+            config: Optional configuration including thread_id
+
+        Yields:
+            Streaming chunks from the graph execution
+        """
+        stream = self._astream(input, config)
+        while True:
+            try:
+                chunk = await asyncio.wrap_future(self._submit(_anext(stream)))
+            except StopAsyncIteration:
+                return
+            yield chunk
 
 
 # =============================================================================
-# Legacy exports for backwards compatibility and local testing
+# Shared by BountyOrchestrator and the local graph (see local_graph.py)
 # =============================================================================
 
 
-def get_checkpointer():
-    """Get checkpointer for local testing.
+DEFAULT_RECURSION_LIMIT = 50
 
-    DEPRECATED: Use BountyOrchestrator class for Agent Engine deployment.
-    """
-    database_url = os.environ.get("DATABASE_URL")
 
-    if database_url:
-        from langgraph.checkpoint.postgres import PostgresSaver
+def make_config(
+    thread_id: str, recursion_limit: int = DEFAULT_RECURSION_LIMIT
+) -> Dict[str, Any]:
+    """Build the run config for one workflow thread.
 
-        return PostgresSaver.from_conn_string(database_url)
-    else:
-        from langgraph.checkpoint.memory import MemorySaver
-
-        return MemorySaver()
+    Every graph call (orchestrator queries and the API endpoints) goes
+    through here so thread_id and recursion_limit are set the same way.
+    """
+    return {
+        "configurable": {"thread_id": thread_id},
+        "recursion_limit": recursion_limit,
+    }
 
 
-def _build_graph():
-    """Build graph for local testing.
+@functools.cache
+def make_workflow():
+    """Build the (uncompiled) bounty workflow graph.
 
-    DEPRECATED: Use BountyOrchestrator class for Agent Engine deployment.
+    The single definition of the node/edge wiring, built once per process
+    and compiled by each entry point (BountyOrchestrator, local_graph) with
+    its own checkpointer. Imports are
+    local so unpickling BountyOrchestrator does not pull in LangGraph.
     """
-    from langgraph.graph import StateGraph, END
+    from langgraph.graph import StateGraph, START, END
 
     from .state import BountyState
     from .nodes import (
@@ -287,19 +390,30 @@ def _build_graph():
 
     workflow = StateGraph(BountyState)
 
+    # Add nodes
     workflow.add_node("analyze", analyze_bounty)
     workflow.add_node("check_competition", check_competition)
+    workflow.add_node("join_analysis", lambda s: {})  # Fan-in barrier
     workflow.add_node("create_plan", create_plan)
-    workflow.add_node("approval", lambda s: s)
+    workflow.add_node("approval", lambda s: {})  # Human checkpoint
     workflow.add_node("execute", execute_via_bob)
 
-    workflow.set_entry_point("analyze")
-    workflow.add_edge("analyze", "check_competition")
+    # analyze and check_competition are independent Bob calls, so they run
+    # in the same superstep. They write disjoint state keys, which lets
+    # LangGraph apply both updates without reducers.
+    workflow.add_edge(START, "analyze")
+    workflow.add_edge(START, "check_competition")
+
+    # join_analysis waits for both branches before routing
+    workflow.add_edge(["analyze", "check_competition"], "join_analysis")
 
     workflow.add_conditional_edges(
-        "check_competition",
+        "join_analysis",
         should_proceed,
-        {"continue": "create_plan", "skip": END},
+        {
+            "continue": "create_plan",
+            "skip": END,
+        },
     )
 
     workflow.add_edge("create_plan", "approval")
@@ -307,44 +421,32 @@ def _build_graph():
     workflow.add_conditional_edges(
         "approval",
         is_approved,
-        {"execute": "execute", "rejected": END},
+        {
+            "execute": "execute",
+            "rejected": END,
+        },
     )
 
     workflow.add_edge("execute", END)
 
-    return workflow.compile(checkpointer=get_checkpointer())
+    return workflow
 
 
-# Legacy export for langgraph.json and local testing
-# For Agent Engine, use BountyOrchestrator class instead
-# Lazy-loaded to prevent import errors when langgraph not installed
-_graph_instance = None
-
-
-def get_graph():
-    """Get or create the compiled graph. Lazy-loaded."""
-    global _graph_instance
-    if _graph_instance is None:
-        _graph_instance = _build_graph()
-    return _graph_instance
-
-
-# For backwards compatibility with langgraph.json which expects 'graph'
-# This creates a lazy property-like behavior
-class _LazyGraph:
-    """Lazy wrapper for graph to defer initialization until first access."""
+def get_checkpointer():
+    """Get checkpointer for local testing and the FastAPI server.
 
-    _instance = None
+    With DATABASE_URL set this returns an AsyncPostgresSaver backed by the
+    shared connection pool, so it must be called from a running event loop.
+    """
+    database_url = os.environ.get("DATABASE_URL")
 
-    def __getattr__(self, name):
-        if _LazyGraph._instance is None:
-            _LazyGraph._instance = _build_graph()
-        return getattr(_LazyGraph._instance, name)
+    if database_url:
+        from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 
-    def __call__(self, *args, **kwargs):
-        if _LazyGraph._instance is None:
-            _LazyGraph._instance = _build_graph()
-        return _LazyGraph._instance(*args, **kwargs)
+        from .db import get_pool
 
+        return AsyncPostgresSaver(get_pool())
+    else:
+        from langgraph.checkpoint.memory import MemorySaver
 
-graph = _LazyGraph()
+        return MemorySaver()
@@ -8,26 +8,160 @@ This module provides REST endpoints for the dashboard to:
 - Search learnings
 """
 
-import uuid
-from typing import Optional
-
-from fastapi import FastAPI, BackgroundTasks, HTTPException
+import asyncio
+import logging
+import os
+import secrets
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+import orjson
+from fastapi import FastAPI, Depends, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
-from .agent import graph
-from .state import BountyState
+from .agent import make_config
+from .local_graph import get_graph
+from .state import new_bounty_state
 from .memory import get_store, MemoryManager
-from .knowledge import sync_repo_knowledge, record_submission_outcome
+from .knowledge import (
+    get_repo_profile,
+    is_stale,
+    make_repo_id,
+    record_submission_outcome,
+    sync_repo_knowledge,
+)
+from .db import get_pool, open_pool, close_pool, create_store_indexes
+from .bobs_brain_client import bob
+from .cache import TTLCache
+from .jobs import JobQueue, JobQueueFullError
+
+logger = logging.getLogger(__name__)
+
+# Workflow runs and repo syncs go through a bounded job queue. Its worker
+# count caps how many execute at once, so a burst of starts/approvals can't
+# exhaust the Postgres pool or Bob's Brain; once the queue is full, new work
+# is refused with 503 and /health reports overloaded. Shutdown drains it.
+MAX_CONCURRENT_BOUNTIES = int(os.environ.get("MAX_CONCURRENT_BOUNTIES", "8"))
+MAX_INFLIGHT_TASKS = int(os.environ.get("MAX_INFLIGHT_TASKS", "64"))
+SHUTDOWN_DRAIN_TIMEOUT = float(os.environ.get("SHUTDOWN_DRAIN_TIMEOUT", "30"))
+_jobs = JobQueue(workers=MAX_CONCURRENT_BOUNTIES, maxsize=MAX_INFLIGHT_TASKS)
+
+# The dashboard polls the list and learnings GETs several times a second;
+# serve those from short-lived caches instead of hitting the store (and the
+# embedding model) each time. Entries are the encoded JSON body, so a cache
+# hit skips serialization too. Expired entries are served for CACHE_STALE_TTL
+# more seconds while one background load refreshes them. Mutating endpoints
+# invalidate the affected keys.
+LIST_CACHE_TTL = float(os.environ.get("LIST_CACHE_TTL", "5"))
+LEARNINGS_CACHE_TTL = float(os.environ.get("LEARNINGS_CACHE_TTL", "60"))
+CACHE_STALE_TTL = float(os.environ.get("CACHE_STALE_TTL", "30"))
+_list_cache = TTLCache(ttl=LIST_CACHE_TTL, maxsize=16, stale_ttl=CACHE_STALE_TTL)
+_learnings_cache = TTLCache(
+    ttl=LEARNINGS_CACHE_TTL, maxsize=256, stale_ttl=CACHE_STALE_TTL
+)
+_NO_STORE_HEADERS = {"Cache-Control": "no-store"}
+
+
+async def _setup_store() -> None:
+    """Run store migrations, then create the app's store indexes."""
+    await get_store().setup()
+    await create_store_indexes()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Prepare per-process resources before the first request is served.
+
+    Opens the shared Postgres pool, runs migrations once, and compiles the
+    workflow graph so no request pays the first-compile cost. The memory
+    manager is created here, once, so concurrent first requests can't each
+    build their own.
+    """
+    if os.environ.get("DATABASE_URL"):
+        from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+
+        await open_pool()
+        # Checkpointer and store migrations touch separate tables; run them
+        # side by side to shorten startup
+        await asyncio.gather(AsyncPostgresSaver(get_pool()).setup(), _setup_store())
+    app.state.store = get_store()
+    app.state.memory = MemoryManager(app.state.store)
+    await app.state.memory.backfill_indexes()
+    app.state.graph = get_graph()
+    _jobs.start()
+    yield
+    await _jobs.stop(SHUTDOWN_DRAIN_TIMEOUT)
+    await bob.aclose()
+    await close_pool()
+
+
+def _enqueue(func, *args, job_id: Optional[str] = None) -> None:
+    """Queue background work, mapping a full queue to 503."""
+    try:
+        _jobs.enqueue(func, *args, job_id=job_id)
+    except JobQueueFullError:
+        raise HTTPException(status_code=503, detail="Too many queued jobs")
+
 
 # FastAPI app
 app = FastAPI(
     title="Bounty Orchestrator API",
     description="LangGraph-based bounty workflow orchestration",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
+# Health probes are answered before routing: a raw ASGI middleware sends a
+# prebuilt body, skipping route matching and response-model serialization.
+_HEALTHY_BODY = b'{"status":"healthy","service":"bounty-orchestrator"}'
+_OVERLOADED_BODY = b'{"status":"overloaded","service":"bounty-orchestrator"}'
+
+
+class HealthMiddleware:
+    """Serve /health without entering the FastAPI router.
+
+    Returns 503 while the job queue is full so the load balancer routes
+    new work to other pods.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] != "/health":
+            await self.app(scope, receive, send)
+            return
+
+        if _jobs.full():
+            status, body = 503, _OVERLOADED_BODY
+        else:
+            status, body = 200, _HEALTHY_BODY
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    # Probes must always reach the pod, never a cache
+                    (b"cache-control", b"no-store"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+app.add_middleware(HealthMiddleware)
+
+
 # Request/Response models
+#
+# Endpoints declare a response_model and keep FastAPI's default response
+# class, so responses are serialized straight to JSON bytes by pydantic-core
+# instead of going through jsonable_encoder and json.dumps.
 class StartWorkflowRequest(BaseModel):
     """Request to start a bounty workflow."""
 
@@ -68,28 +202,72 @@ class RecordOutcomeRequest(BaseModel):
     reviewer_feedback: Optional[str] = None
 
 
-# Memory manager instance (initialized lazily)
-_memory = None
+class SyncRepoResponse(BaseModel):
+    """Response from scheduling a repo sync."""
+
+    status: str
+    repo_url: str
+
+
+class RecordOutcomeResponse(BaseModel):
+    """Response from recording a bounty outcome."""
+
+    status: str
+    bounty_id: str
+    outcome: str
+
+
+def _app_memory(request: Request) -> MemoryManager:
+    """Dependency returning the memory manager created during lifespan startup."""
+    return request.app.state.memory
+
+
+def _app_graph(request: Request):
+    """Dependency returning the graph compiled during lifespan startup."""
+    return request.app.state.graph
+
+
+# One lock per thread_id, held while a run is in progress. Weak values drop
+# each lock once no run holds or waits on it. This serializes runs within
+# one process only; replicas rely on the checkpointer.
+_workflow_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+    weakref.WeakValueDictionary()
+)
 
 
-def _get_memory() -> MemoryManager:
-    """Get or create the MemoryManager instance."""
-    global _memory
-    if _memory is None:
-        _memory = MemoryManager()
-    return _memory
+async def _run_workflow(graph, state: Optional[dict], config: dict) -> None:
+    """Run (or resume, when state is None) the workflow for one thread.
 
+    Executed by a job queue worker after the request returns. Runs for the
+    same thread wait for each other instead of advancing its state
+    concurrently. Failures are logged rather than raised, since there is no
+    client left to receive them.
+    """
+    thread_id = config["configurable"]["thread_id"]
+    lock = _workflow_locks.setdefault(thread_id, asyncio.Lock())
+    try:
+        async with lock:
+            await graph.ainvoke(state, config)
+    except Exception:
+        logger.exception(f"Workflow run failed for {thread_id}")
 
-def _is_store_configured(store) -> bool:
-    """Check if store is properly configured (not a fallback dict)."""
-    return not isinstance(store, dict)
+
+async def _sync_repo(repo_url: str, store) -> None:
+    """Sync a repo's knowledge, then drop the cached repo list."""
+    try:
+        # sync_repo already decided this sync is needed
+        await sync_repo_knowledge(repo_url, store, force=True)
+    except Exception:
+        logger.exception(f"Repo sync failed for {repo_url}")
+    finally:
+        _list_cache.invalidate(("repos",))
 
 
 # Endpoints
 @app.post("/api/bounty/start", response_model=StartWorkflowResponse)
 async def start_bounty_workflow(
     request: StartWorkflowRequest,
-    background_tasks: BackgroundTasks,
+    graph=Depends(_app_graph),
 ):
     """Start bounty analysis and planning workflow.
 
@@ -101,31 +279,19 @@ async def start_bounty_workflow(
 
     The workflow runs in the background. Use /status to check progress.
     """
-    session_id = f"bounty-{request.bounty_id}-{uuid.uuid4().hex[:8]}"
+    session_id = "bounty-" + request.bounty_id + "-" + secrets.token_hex(4)
 
-    # Generate repo_id from URL
-    repo_id = (
-        request.repo.replace("/", "_").replace(":", "_").replace("https___", "")
+    initial_state = new_bounty_state(
+        bounty_id=request.bounty_id,
+        issue_url=request.issue_url,
+        repo=request.repo,
+        repo_id=make_repo_id(request.repo),
+        session_id=session_id,
     )
 
-    initial_state: BountyState = {
-        "bounty_id": request.bounty_id,
-        "issue_url": request.issue_url,
-        "repo": request.repo,
-        "repo_id": repo_id,
-        "issue_details": {},
-        "competition_analysis": {},
-        "implementation_plan": {},
-        "phase": "A",
-        "human_approved": False,
-        "execution_result": {},
-        "session_id": session_id,
-        "repo_profile": None,
-    }
-
     # Run workflow in background
-    config = {"configurable": {"thread_id": request.bounty_id}}
-    background_tasks.add_task(graph.ainvoke, initial_state, config)
+    config = make_config(request.bounty_id)
+    _enqueue(_run_workflow, graph, initial_state, config, job_id=session_id)
 
     return StartWorkflowResponse(
         status="analyzing",
@@ -135,15 +301,15 @@ async def start_bounty_workflow(
 
 
 @app.get("/api/bounty/{bounty_id}/status", response_model=WorkflowStatus)
-async def get_bounty_status(bounty_id: str):
+async def get_bounty_status(bounty_id: str, graph=Depends(_app_graph)):
     """Get current workflow state for a bounty.
 
     Returns the current node, phase, and full state.
     """
-    config = {"configurable": {"thread_id": bounty_id}}
+    config = make_config(bounty_id)
 
     try:
-        state = graph.get_state(config)
+        state = await graph.aget_state(config)
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Bounty not found: {e}")
 
@@ -160,205 +326,290 @@ async def get_bounty_status(bounty_id: str):
 
 
 @app.post("/api/bounty/{bounty_id}/approve", response_model=ApproveResponse)
-async def approve_execution(bounty_id: str, background_tasks: BackgroundTasks):
+async def approve_execution(
+    bounty_id: str,
+    graph=Depends(_app_graph),
+):
     """Human approves - resume workflow to execute.
 
     This sets human_approved=True and resumes the workflow,
     which will then proceed to the execute node.
     """
-    config = {"configurable": {"thread_id": bounty_id}}
+    config = make_config(bounty_id)
 
     try:
         # Update state to mark as approved
-        graph.update_state(config, {"human_approved": True, "phase": "D"})
+        await graph.aupdate_state(config, {"human_approved": True, "phase": "D"})
 
-        # Resume workflow in background
-        background_tasks.add_task(graph.ainvoke, None, config)
+        # Resume workflow in background from the thread's latest checkpoint,
+        # so a repeated approval after the run finished doesn't execute
+        # again; the job id drops one that arrives while it is still queued
+        # or running.
+        _enqueue(_run_workflow, graph, None, config, job_id=f"run:{bounty_id}")
+        _list_cache.invalidate(("bounties",))
 
         return ApproveResponse(status="executing", bounty_id=bounty_id)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Approval failed: {e}")
 
 
 @app.post("/api/bounty/{bounty_id}/reject", response_model=ApproveResponse)
-async def reject_execution(bounty_id: str):
+async def reject_execution(bounty_id: str, graph=Depends(_app_graph)):
     """Human rejects - end workflow without executing.
 
     This marks the bounty as rejected and ends the workflow.
     """
-    config = {"configurable": {"thread_id": bounty_id}}
+    config = make_config(bounty_id)
 
     try:
-        graph.update_state(
+        await graph.aupdate_state(
             config, {"human_approved": False, "phase": "F", "outcome": "rejected"}
         )
+        _list_cache.invalidate(("bounties",))
         return ApproveResponse(status="rejected", bounty_id=bounty_id)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Rejection failed: {e}")
 
 
 @app.get("/api/repos")
-async def list_repos():
+async def list_repos(memory: MemoryManager = Depends(_app_memory)):
     """List all tracked repos with summaries."""
-    memory = _get_memory()
+    return await _cached_json(_list_cache, ("repos",), lambda: _load_repos(memory))
 
-    try:
-        repos = await memory.list_repos()
-        return [
-            {
-                "id": repo_id,
-                "summary": profile.get("quick_summary", []),
-                "url": profile.get("url", ""),
-                "links": profile.get("links", {}),
-                "last_synced": profile.get("last_synced"),
-            }
-            for repo_id, profile in repos
-        ]
-    except Exception:
-        return []
+
+async def _load_repos(memory: MemoryManager) -> bytes:
+    """Read and encode the repo list (cached by list_repos)."""
+    repos = await memory.list_repos()
+    return orjson.dumps(
+        [_compact({"id": repo_id, **summary}) for repo_id, summary in repos]
+    )
 
 
 @app.get("/api/repos/{repo_id}")
-async def get_repo_detail(repo_id: str):
+async def get_repo_detail(repo_id: str, memory: MemoryManager = Depends(_app_memory)):
     """Get full repo profile for deep dive."""
-    memory = _get_memory()
-
     try:
         profile = await memory.get_repo_profile(repo_id)
         if not profile:
             raise HTTPException(status_code=404, detail="Repo not found")
-        return profile
+        return _json_response(profile)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/repos/sync")
-async def sync_repo(repo_url: str, background_tasks: BackgroundTasks):
+@app.post("/api/repos/sync", response_model=SyncRepoResponse)
+async def sync_repo(
+    repo_url: str,
+    force: bool = False,
+    memory: MemoryManager = Depends(_app_memory),
+):
     """Sync knowledge for a repository.
 
     This fetches CONTRIBUTING.md, analyzes style, and stores the profile.
+    A profile synced within the staleness window is left alone (status
+    "fresh") unless force=true.
     """
-    store = get_store()
+    store = memory.store
 
-    if not _is_store_configured(store):
-        raise HTTPException(status_code=503, detail="Store not configured")
+    if not force:
+        profile = await get_repo_profile(make_repo_id(repo_url), store)
+        if profile and not is_stale(profile.get("last_synced")):
+            return SyncRepoResponse(status="fresh", repo_url=repo_url)
 
-    background_tasks.add_task(sync_repo_knowledge, repo_url, store)
+    # A sync already queued or running for this repo is not repeated, however
+    # its URL is spelled
+    _enqueue(_sync_repo, repo_url, store, job_id=f"sync:{make_repo_id(repo_url)}")
 
-    return {"status": "syncing", "repo_url": repo_url}
+    return SyncRepoResponse(status="syncing", repo_url=repo_url)
 
 
 @app.get("/api/bounties")
-async def list_bounties():
+async def list_bounties(memory: MemoryManager = Depends(_app_memory)):
     """List all bounties with current phase."""
-    store = get_store()
+    return await _cached_json(
+        _list_cache, ("bounties",), lambda: _load_bounties(memory)
+    )
 
-    if not _is_store_configured(store):
-        return []
 
-    try:
-        bounties = await store.alist(namespace=("bounties",))
-        return [
-            {
-                "id": b.key,
-                "issue_summary": b.value.get("issue_summary", ""),
-                "phase": b.value.get("phase", ""),
-                "repo_id": b.value.get("repo_id", ""),
-                "outcome": b.value.get("outcome"),
-            }
-            for b in bounties
-        ]
-    except Exception:
-        return []
+async def _load_bounties(memory: MemoryManager) -> bytes:
+    """Read and encode the bounty list (cached by list_bounties)."""
+    bounties = await memory.list_bounties()
+    return orjson.dumps(
+        [_compact({"id": bounty_id, **summary}) for bounty_id, summary in bounties]
+    )
 
 
 @app.get("/api/bounties/{bounty_id}")
-async def get_bounty_detail(bounty_id: str):
+async def get_bounty_detail(
+    bounty_id: str, memory: MemoryManager = Depends(_app_memory)
+):
     """Get full bounty state."""
-    memory = _get_memory()
-
     try:
         state = await memory.get_bounty_state(bounty_id)
         if not state:
             raise HTTPException(status_code=404, detail="Bounty not found")
-        return state
+        return _json_response(state)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/bounties/{bounty_id}/outcome")
-async def record_outcome(bounty_id: str, request: RecordOutcomeRequest):
+@app.post("/api/bounties/{bounty_id}/outcome", response_model=RecordOutcomeResponse)
+async def record_outcome(
+    bounty_id: str,
+    request: RecordOutcomeRequest,
+    memory: MemoryManager = Depends(_app_memory),
+):
     """Record the outcome of a bounty submission.
 
     Call this when a PR is merged, rejected, or abandoned.
     This records learnings for future reference.
     """
-    store = get_store()
-
-    if not _is_store_configured(store):
-        raise HTTPException(status_code=503, detail="Store not configured")
-
     try:
         await record_submission_outcome(
             bounty_id=bounty_id,
             outcome=request.outcome,
             reviewer_feedback=request.reviewer_feedback,
-            store=store,
+            store=memory.store,
+        )
+        _list_cache.invalidate(("bounties",))
+        _learnings_cache.invalidate()
+        return RecordOutcomeResponse(
+            status="recorded", bounty_id=bounty_id, outcome=request.outcome
         )
-        return {"status": "recorded", "bounty_id": bounty_id, "outcome": request.outcome}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/learnings")
-async def search_learnings(query: str = "", limit: int = 10):
+async def search_learnings(
+    query: str = "", limit: int = 10, memory: MemoryManager = Depends(_app_memory)
+):
     """Semantic search over past learnings."""
-    memory = _get_memory()
-
-    try:
-        results = await memory.search_learnings(query=query, limit=limit)
-        return results
-    except Exception:
-        return []
+    return await _cached_json(
+        _learnings_cache,
+        ("learnings", None, query, limit),
+        lambda: _load_learnings(memory, query, None, limit),
+    )
 
 
+# The category namespace already selects these learnings; listing it by
+# recency needs no query embedding.
 @app.get("/api/learnings/rejections")
-async def list_rejections(limit: int = 20):
+async def list_rejections(
+    limit: int = 20, memory: MemoryManager = Depends(_app_memory)
+):
     """List recent rejection learnings."""
-    memory = _get_memory()
-
-    try:
-        results = await memory.search_learnings(
-            query="rejection",
-            category="rejections",
-            limit=limit,
-        )
-        return results
-    except Exception:
-        return []
+    return await _cached_json(
+        _learnings_cache,
+        ("learnings", "rejections", limit),
+        lambda: _load_learnings(memory, "", "rejections", limit),
+    )
 
 
 @app.get("/api/learnings/successes")
-async def list_successes(limit: int = 20):
+async def list_successes(limit: int = 20, memory: MemoryManager = Depends(_app_memory)):
     """List recent success learnings."""
-    memory = _get_memory()
+    return await _cached_json(
+        _learnings_cache,
+        ("learnings", "successes", limit),
+        lambda: _load_learnings(memory, "", "successes", limit),
+    )
 
-    try:
-        results = await memory.search_learnings(
-            query="success merged",
-            category="successes",
-            limit=limit,
+
+async def _load_learnings(
+    memory: MemoryManager, query: str, category: Optional[str], limit: int
+) -> bytes:
+    """Search and encode learnings (cached by the learnings endpoints)."""
+    results = await memory.search_learnings(
+        query=query,
+        category=category,
+        limit=limit,
+    )
+    return orjson.dumps([_compact(r) for r in results])
+
+
+def _compact(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop null fields from a list item (e.g. an unset outcome or score).
+
+    Equivalent to response_model_exclude_none for the cached list bodies,
+    which are encoded by orjson rather than through a response model.
+    """
+    return {k: v for k, v in record.items() if v is not None}
+
+
+# Detail records above this many encoded bytes are streamed field by field
+STREAM_THRESHOLD = 100 * 1024
+
+
+def _json_response(data: Any) -> Response:
+    """Encode a free-form store record with orjson.
+
+    Endpoints with a response model are serialized by pydantic-core; this is
+    for records without a fixed schema, which would otherwise go through
+    jsonable_encoder and json.dumps.
+
+    Dicts are encoded one top-level field at a time. Once the encoded size
+    passes STREAM_THRESHOLD the rest is streamed, so a large state (plans,
+    competition analysis) is never held as one serialized buffer.
+    """
+    if not isinstance(data, dict):
+        return Response(orjson.dumps(data), media_type="application/json")
+
+    fields = iter(data.items())
+    head = []
+    size = 0
+    for key, value in fields:
+        part = _encode_field(key, value, first=not head)
+        head.append(part)
+        size += len(part)
+        if size > STREAM_THRESHOLD:
+            return StreamingResponse(
+                _stream_fields(head, fields), media_type="application/json"
+            )
+    return Response(b"{" + b"".join(head) + b"}", media_type="application/json")
+
+
+def _encode_field(key: str, value: Any, first: bool) -> bytes:
+    """Encode one object member, with its leading comma unless first."""
+    member = orjson.dumps(key) + b":" + orjson.dumps(value)
+    return member if first else b"," + member
+
+
+async def _stream_fields(head: list, rest) -> AsyncIterator[bytes]:
+    """Yield an object's already-encoded fields, then encode the rest."""
+    yield b"{"
+    for part in head:
+        yield part
+    for key, value in rest:
+        yield _encode_field(key, value, first=False)
+    yield b"}"
+
+
+def _cache_control(cache: TTLCache) -> Dict[str, str]:
+    """Cache-Control header letting clients and the CDN mirror a cache."""
+    ttl = int(cache.ttl)
+    return {
+        "Cache-Control": (
+            f"public, max-age={ttl}, s-maxage={ttl}, "
+            f"stale-while-revalidate={int(cache.stale_ttl)}"
         )
-        return results
-    except Exception:
-        return []
+    }
+
 
+async def _cached_json(cache: TTLCache, key: tuple, loader) -> Response:
+    """Serve a cached JSON body, loading it on a miss.
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "service": "bounty-orchestrator"}
+    Store errors degrade to an empty list that downstream caches must not
+    keep.
+    """
+    try:
+        body = await cache.get_or_load(key, loader)
+    except Exception:
+        return Response(b"[]", media_type="application/json", headers=_NO_STORE_HEADERS)
+    return Response(body, media_type="application/json", headers=_cache_control(cache))
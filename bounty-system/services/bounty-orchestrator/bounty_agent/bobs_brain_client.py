@@ -4,6 +4,7 @@ import os
 from typing import Optional
 
 import httpx
+import orjson
 
 
 class BobsBrainClient:
@@ -22,6 +23,29 @@ class BobsBrainClient:
         self.base_url = base_url or os.environ.get(
             "BOBS_BRAIN_A2A_URL", "http://localhost:8080"
         )
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client.
+
+        Created on first use (inside the event loop that will use it) and
+        kept for the life of the process, so repeat calls reuse keep-alive
+        connections instead of redoing DNS/TCP/TLS per prompt.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"Content-Type": "application/json"},
+                timeout=httpx.Timeout(120.0, connect=5.0),  # Bob may take time
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def ask_bob(
         self,
@@ -41,27 +65,28 @@ class BobsBrainClient:
         Returns:
             Response from Bob's Brain with the execution result
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/a2a/run",
-                    json={
+        try:
+            # Encoded with orjson; the client already sends the JSON
+            # Content-Type, so httpx's stdlib json= path isn't needed
+            response = await self._get_client().post(
+                "/a2a/run",
+                content=orjson.dumps(
+                    {
                         "agent_role": "bob",  # Bob routes to right specialist
                         "prompt": prompt,
                         "context": context or {},
                         "session_id": session_id,
-                    },
-                    headers={"Content-Type": "application/json"},
-                    timeout=120.0,  # Bob may take time for complex tasks
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPError as e:
-                # Return error response for graceful handling
-                return {
-                    "error": str(e),
-                    "response": {},
-                }
+                    }
+                ),
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError as e:
+            # Return error response for graceful handling
+            return {
+                "error": str(e),
+                "response": {},
+            }
 
 
 # Singleton instance for convenience
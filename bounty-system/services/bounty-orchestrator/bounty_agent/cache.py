@@ -0,0 +1,104 @@
+"""In-process TTL cache for async loaders.
+
+Used in front of store reads that the dashboard polls. Concurrent misses
+for the same key share one in-flight load, so N identical requests inside
+a TTL window cost one store round-trip.
+"""
+
+import asyncio
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class TTLCache:
+    """Small async-aware cache with per-entry expiry.
+
+    Values are fresh for ``ttl`` seconds. For a further ``stale_ttl``
+    seconds an expired value is still returned immediately while a single
+    background load refreshes it (stale-while-revalidate). When ``maxsize``
+    is reached the oldest entry is evicted. Failed loads are not cached.
+
+    Keys are tuples so related entries can be dropped together with
+    ``invalidate(prefix)``.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128, stale_ttl: float = 0.0):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        self._data: Dict[Tuple[Hashable, ...], Tuple[float, Any]] = {}
+        self._inflight: Dict[Tuple[Hashable, ...], asyncio.Future] = {}
+        # Bumped on invalidation so loads started earlier don't repopulate
+        self._generation = 0
+
+    async def get_or_load(
+        self,
+        key: Tuple[Hashable, ...],
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached value for key, loading it on a miss.
+
+        Args:
+            key: Cache key
+            loader: Zero-argument coroutine function producing the value
+
+        Returns:
+            The cached (possibly stale) or freshly loaded value
+        """
+        entry = self._data.get(key)
+        if entry is not None:
+            fresh_until, value = entry
+            now = time.monotonic()
+            if now < fresh_until:
+                return value
+            if now < fresh_until + self.stale_ttl:
+                # Serve stale, refresh in the background
+                self._load(key, loader)
+                return value
+
+        # Shield so one cancelled caller doesn't cancel the shared load
+        return await asyncio.shield(self._load(key, loader))
+
+    def set(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        """Store a value for key with a fresh expiry."""
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, prefix: Tuple[Hashable, ...] = ()) -> None:
+        """Drop every key starting with prefix (all keys by default)."""
+        self._generation += 1
+        if not prefix:
+            self._data.clear()
+            return
+        n = len(prefix)
+        for key in [k for k in self._data if k[:n] == prefix]:
+            del self._data[key]
+
+    def _load(
+        self,
+        key: Tuple[Hashable, ...],
+        loader: Callable[[], Awaitable[Any]],
+    ) -> asyncio.Future:
+        """Start a load for key, or join the one already in flight."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(loader())
+            self._inflight[key] = task
+            task.add_done_callback(
+                functools.partial(self._finish, key, self._generation)
+            )
+        return task
+
+    def _finish(
+        self, key: Tuple[Hashable, ...], generation: int, task: asyncio.Future
+    ) -> None:
+        """Record a completed load unless it was invalidated meanwhile."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if generation == self._generation:
+            self.set(key, task.result())
@@ -0,0 +1,116 @@
+"""Shared PostgreSQL connection pool.
+
+The workflow checkpointer (AsyncPostgresSaver) and the long-term memory
+store (AsyncPostgresStore) both draw connections from one process-wide
+AsyncConnectionPool, so concurrent workflow threads no longer serialize on
+a single connection and a dropped connection is replaced transparently.
+
+The pool is created closed; call open_pool() from inside the running event
+loop (FastAPI lifespan, BountyOrchestrator set-up) before first use. It
+waits for the minimum connections, so the first request doesn't pay
+connection setup. Checkout is bounded by PG_POOL_TIMEOUT and connections
+are health-checked, so a saturated pool or dead connection fails fast
+instead of stalling a request.
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+_pool = None
+
+
+def get_pool():
+    """Get or create the process-wide connection pool.
+
+    Requires DATABASE_URL. The connection kwargs are the ones LangGraph's
+    Postgres checkpointer and store expect (autocommit, dict rows,
+    prepare_threshold=0: every statement is prepared server-side on first
+    use, so repeats skip parse/plan). Sized by PG_POOL_MIN/PG_POOL_MAX.
+
+    Returns:
+        psycopg_pool.AsyncConnectionPool (not yet opened)
+    """
+    global _pool
+    if _pool is None:
+        from psycopg.rows import dict_row
+        from psycopg_pool import AsyncConnectionPool
+
+        _pool = AsyncConnectionPool(
+            conninfo=os.environ["DATABASE_URL"],
+            min_size=int(os.environ.get("PG_POOL_MIN", "5")),
+            max_size=int(os.environ.get("PG_POOL_MAX", "10")),
+            timeout=float(os.environ.get("PG_POOL_TIMEOUT", "2")),
+            check=AsyncConnectionPool.check_connection,
+            configure=_configure_connection,
+            kwargs={
+                "autocommit": True,
+                "prepare_threshold": 0,
+                "row_factory": dict_row,
+            },
+            open=False,
+        )
+    return _pool
+
+
+async def _configure_connection(conn) -> None:
+    """Session settings applied to every new pooled connection.
+
+    hnsw.ef_search (pgvector default 40) is the candidate list size for
+    semantic search; a larger list trades a little latency for recall.
+
+    prepared_max (psycopg default 100) bounds the per-connection cache of
+    prepared statements. LangGraph's store and checkpointer emit a query
+    text per batch shape, so the default evicts and re-prepares the hot
+    queries; PG_PREPARED_MAX keeps them resident.
+    """
+    conn.prepared_max = int(os.environ.get("PG_PREPARED_MAX", "1024"))
+    ef_search = int(os.environ.get("HNSW_EF_SEARCH", "100"))
+    await conn.execute(f"SET hnsw.ef_search = {ef_search}")
+
+
+# Indexes the app adds to LangGraph's store tables:
+# - an expression index on the JSON field bounties are filtered on. Partial
+#   on IS NOT NULL so only records carrying the field (bounty states and
+#   their list summaries) are indexed; an equality filter on the field
+#   implies the predicate, so the planner can use it.
+# - a Hamming-distance HNSW index over the binary-quantized embeddings,
+#   the first stage of learnings search (memory._search_reranked). The
+#   bit width must match the embedding dims (memory.EMBEDDING_DIMS).
+STORE_INDEXES = (
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS store_value_phase_idx "
+    "ON store ((value -> 'phase')) WHERE (value -> 'phase') IS NOT NULL",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS store_vectors_binary_idx "
+    "ON store_vectors USING hnsw "
+    "((binary_quantize(embedding)::bit(768)) bit_hamming_ops)",
+)
+
+
+async def create_store_indexes() -> None:
+    """Create the app's store indexes if missing (after store.setup())."""
+    async with get_pool().connection() as conn:
+        for statement in STORE_INDEXES:
+            try:
+                await conn.execute(statement)
+            except Exception as e:
+                # Another instance may be building the same index
+                logger.warning(f"Store index creation skipped: {e}")
+
+
+async def open_pool() -> None:
+    """Open the shared pool and wait for its minimum connections.
+
+    Safe to call more than once.
+    """
+    await get_pool().open(wait=True)
+    logger.info("Opened PostgreSQL connection pool")
+
+
+async def close_pool() -> None:
+    """Close the shared pool if it was created."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+        logger.info("Closed PostgreSQL connection pool")
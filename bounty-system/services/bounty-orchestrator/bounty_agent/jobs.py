@@ -0,0 +1,122 @@
+"""In-process job queue for long-running background work.
+
+The API enqueues workflow runs and repo syncs here; a fixed pool of worker
+tasks on the server's event loop executes them. Enqueueing is a
+non-blocking put, so request latency never includes graph execution, and
+the bounded queue gives back-pressure instead of unbounded task growth.
+
+Jobs with an id are deduplicated while queued or running.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueFullError(Exception):
+    """Raised when a job is enqueued while the queue is at capacity."""
+
+
+class JobQueue:
+    """Bounded asyncio queue drained by a fixed number of workers.
+
+    Usage:
+        jobs = JobQueue(workers=8, maxsize=64)
+        jobs.start()                      # inside the running event loop
+        jobs.enqueue(run_workflow, state, config, job_id="bounty-1")
+        await jobs.stop(timeout=30)       # drain, then cancel workers
+    """
+
+    def __init__(self, workers: int, maxsize: int):
+        self.workers = workers
+        self.maxsize = maxsize
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._job_ids: Set[str] = set()
+
+    @property
+    def started(self) -> bool:
+        """Whether workers are running."""
+        return self._queue is not None
+
+    def full(self) -> bool:
+        """Whether the queue is at capacity."""
+        return self._queue is not None and self._queue.full()
+
+    def start(self) -> None:
+        """Create the queue and start the workers on the running loop."""
+        self._queue = asyncio.Queue(self.maxsize)
+        self._worker_tasks = [
+            asyncio.create_task(self._work(), name=f"job-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    def enqueue(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        job_id: Optional[str] = None,
+    ) -> bool:
+        """Queue func(*args) for a worker.
+
+        Args:
+            func: Coroutine function to run
+            *args: Positional arguments for func
+            job_id: Optional id; a job with the same id already queued or
+                running is not queued again
+
+        Returns:
+            True if queued, False if deduplicated
+
+        Raises:
+            JobQueueFullError: If the queue is at capacity
+            RuntimeError: If the queue has not been started
+        """
+        if self._queue is None:
+            raise RuntimeError("Job queue not started")
+        if job_id is not None and job_id in self._job_ids:
+            return False
+        try:
+            self._queue.put_nowait((job_id, func, args))
+        except asyncio.QueueFull:
+            raise JobQueueFullError(f"Job queue is full ({self.maxsize} jobs)")
+        if job_id is not None:
+            self._job_ids.add(job_id)
+        return True
+
+    async def join(self) -> None:
+        """Wait until every job queued so far has finished."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self, timeout: float) -> None:
+        """Wait up to timeout for queued jobs, then cancel the workers."""
+        if self._queue is None:
+            return
+        try:
+            await asyncio.wait_for(self.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Cancelling {self._queue.qsize()} queued job(s) at shutdown"
+            )
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._job_ids.clear()
+        self._queue = None
+
+    async def _work(self) -> None:
+        """Worker loop: run jobs one at a time until cancelled."""
+        queue = self._queue
+        while True:
+            job_id, func, args = await queue.get()
+            try:
+                await func(*args)
+            except Exception:
+                logger.exception(f"Job {job_id or func.__name__} failed")
+            finally:
+                self._job_ids.discard(job_id)
+                queue.task_done()
@@ -1,6 +1,17 @@
 """Knowledge management for bounty workflow."""
 
-from .repo_sync import sync_repo_knowledge, is_stale
+from .repo_sync import (
+    sync_repo_knowledge,
+    is_stale,
+    get_repo_profile,
+    make_repo_id,
+)
 from .learn import record_submission_outcome
 
-__all__ = ["sync_repo_knowledge", "is_stale", "record_submission_outcome"]
+__all__ = [
+    "sync_repo_knowledge",
+    "is_stale",
+    "get_repo_profile",
+    "make_repo_id",
+    "record_submission_outcome",
+]
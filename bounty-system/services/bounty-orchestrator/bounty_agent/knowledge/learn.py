@@ -5,10 +5,15 @@ can learn from successes and failures. Uses semantic search to find similar
 situations in the future.
 """
 
+import asyncio
 import uuid
+from datetime import UTC, datetime
 from typing import Optional
 
 from ..bobs_brain_client import bob
+from ..memory import put_bounty_state, put_learning, update_repo_profile_fields
+from ..prompts.knowledge import REJECTION_LESSON_PROMPT
+from .repo_sync import get_repo_profile
 
 
 async def record_submission_outcome(
@@ -29,7 +34,8 @@ async def record_submission_outcome(
     """
     # Get bounty state
     try:
-        bounty = await store.aget(("bounties", bounty_id), "state")
+        item = await store.aget(("bounties", bounty_id), "state")
+        bounty = item.value if item else None
     except Exception:
         bounty = None
 
@@ -39,67 +45,92 @@ async def record_submission_outcome(
     repo = bounty.get("repo", "unknown")
     repo_id = bounty.get("repo_id", "")
 
-    if outcome == "rejected" and reviewer_feedback:
-        # Ask Bob to extract the lesson
-        result = await bob.ask_bob(f"""
-        Our PR was rejected. Extract the key lesson:
-
-        Repo: {repo}
-        Feedback: {reviewer_feedback}
+    # Update bounty state with outcome
+    bounty["outcome"] = outcome
+    bounty["phase"] = "F"  # Post-submission phase
+    # Learning writes; the state write joins them in the final gather, so
+    # no coroutine is created before a lookup below can raise
+    writes = []
 
-        Return a single clear lesson we should remember for future PRs to this repo.
-        Keep it concise (1-2 sentences).
-        """)
+    if outcome == "rejected" and reviewer_feedback:
+        # Ask Bob to extract the lesson while the repo profile loads
+        result, repo_profile = await asyncio.gather(
+            bob.ask_bob(
+                REJECTION_LESSON_PROMPT.format(
+                    repo=repo, reviewer_feedback=reviewer_feedback
+                )
+            ),
+            get_repo_profile(repo_id, store) if repo_id else _none(),
+        )
 
         learning = result.get("response", reviewer_feedback)
 
         # Store as semantic-searchable learning
         learning_id = f"learn_{uuid.uuid4().hex[:8]}"
-        await store.aput(
-            namespace=("learnings", "rejections"),
-            key=learning_id,
-            value={
-                "bounty_id": bounty_id,
-                "repo": repo,
-                "what_happened": reviewer_feedback,
-                "lesson": learning,
-                "embedding_text": f"{repo} rejection {learning}",  # For semantic search
-                "created_at": __import__("datetime").datetime.now().isoformat(),
-            },
+        writes.append(
+            put_learning(
+                store,
+                "rejections",
+                learning_id,
+                {
+                    "bounty_id": bounty_id,
+                    "repo": repo,
+                    "what_happened": reviewer_feedback,
+                    "lesson": learning,
+                    # For semantic search
+                    "embedding_text": f"{repo} rejection {learning}",
+                    "created_at": _now_iso(),
+                },
+            )
         )
 
         # Also add to repo's gotchas
-        if repo_id:
-            try:
-                repo_profile = await store.aget(("repos", repo_id), "profile")
-                if repo_profile:
-                    gotchas = repo_profile.get("gotchas", [])
-                    if learning not in gotchas:
-                        gotchas.append(learning)
-                        repo_profile["gotchas"] = gotchas
-                        await store.aput(("repos", repo_id), "profile", repo_profile)
-            except Exception:
-                pass  # Don't fail if repo profile update fails
+        if repo_profile:
+            gotchas = repo_profile.get("gotchas", [])
+            if learning not in gotchas:
+                # Patch only the gotchas; the cached profile isn't mutated
+                writes.append(
+                    _update_repo_gotchas(store, repo_id, [*gotchas, learning])
+                )
 
     elif outcome == "merged":
         # Record success for future reference
         success_id = f"success_{uuid.uuid4().hex[:8]}"
-        await store.aput(
-            namespace=("learnings", "successes"),
-            key=success_id,
-            value={
-                "bounty_id": bounty_id,
-                "repo": repo,
-                "what_worked": bounty.get("approach_summary", ""),
-                "embedding_text": f"{repo} success merged",
-                "created_at": __import__("datetime").datetime.now().isoformat(),
-            },
+        writes.append(
+            put_learning(
+                store,
+                "successes",
+                success_id,
+                {
+                    "bounty_id": bounty_id,
+                    "repo": repo,
+                    "what_worked": bounty.get("approach_summary", ""),
+                    "embedding_text": f"{repo} success merged",
+                    "created_at": _now_iso(),
+                },
+            )
         )
 
-    # Update bounty state with outcome
-    bounty["outcome"] = outcome
-    bounty["phase"] = "F"  # Post-submission phase
-    await store.aput(("bounties", bounty_id), "state", bounty)
+    # The writes are independent; issue them together
+    await asyncio.gather(put_bounty_state(store, bounty_id, bounty), *writes)
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string."""
+    return datetime.now(UTC).isoformat()
+
+
+async def _none() -> None:
+    """Placeholder awaitable for an absent lookup in gather()."""
+    return None
+
+
+async def _update_repo_gotchas(store, repo_id: str, gotchas: list) -> None:
+    """Save a repo's gotchas, ignoring failures (gotchas are best effort)."""
+    try:
+        await update_repo_profile_fields(store, repo_id, {"gotchas": gotchas})
+    except Exception:
+        pass  # Don't fail if repo profile update fails
 
 
 async def search_similar_learnings(
@@ -119,7 +150,7 @@ async def search_similar_learnings(
     """
     try:
         results = await store.asearch(
-            namespace=("learnings",),
+            ("learnings",),
             query=query,
             limit=limit,
         )
@@ -4,10 +4,30 @@ This module handles syncing repository knowledge (CONTRIBUTING.md, style rules,
 maintainer preferences) to the LangGraph Store for persistent access.
 """
 
+import asyncio
+import functools
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Hashable, Optional, Tuple
 
 from ..bobs_brain_client import bob
+from ..memory import load_repo_profile, put_repo_profile
+from ..prompts.knowledge import REPO_SYNC_PROMPT
+
+# "/", ":" and "." -> "_" in one pass. Store namespace labels may not
+# contain periods, so "github.com" must not survive into a repo_id.
+_REPO_ID_TRANS = str.maketrans({"/": "_", ":": "_", ".": "_"})
+
+# Syncs in progress, keyed by (store, repo_id)
+_inflight_syncs: Dict[Tuple[Hashable, str], asyncio.Future] = {}
+
+
+@functools.lru_cache(maxsize=1024)
+def make_repo_id(repo_url: str) -> str:
+    """Derive the store repo_id for a repository URL or owner/name.
+
+    Example: "https://github.com/posthog/posthog" -> "github_com_posthog_posthog"
+    """
+    return repo_url.translate(_REPO_ID_TRANS).removeprefix("https___")
 
 
 def is_stale(last_synced: Optional[str], days: int = 7) -> bool:
@@ -30,58 +50,49 @@ def is_stale(last_synced: Optional[str], days: int = 7) -> bool:
         return True
 
 
-async def sync_repo_knowledge(repo_url: str, store) -> str:
+async def sync_repo_knowledge(repo_url: str, store, force: bool = False) -> str:
     """Fetch and store repo knowledge.
 
     Called when:
     1. First time seeing a repo
     2. Before executing a bounty (if stale > 7 days)
 
+    A profile that is still fresh is kept as-is unless force is set, so
+    redundant syncs skip the Bob's Brain round-trip. Concurrent syncs of
+    the same repo (API and workflow nodes alike) share one in-flight
+    analysis.
+
     Args:
         repo_url: GitHub repository URL
         store: LangGraph Store instance
+        force: Re-sync even if the stored profile is fresh
 
     Returns:
         repo_id: The generated repo identifier
     """
-    # Generate repo ID from URL
-    repo_id = repo_url.replace("/", "_").replace(":", "_").replace("https___", "")
+    repo_id = make_repo_id(repo_url)
+
+    if not force:
+        profile = await get_repo_profile(repo_id, store)
+        if profile and not is_stale(profile.get("last_synced")):
+            return repo_id
+
+    key = (store, repo_id)
+    task = _inflight_syncs.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_analyze_repo(repo_url, repo_id, store))
+        _inflight_syncs[key] = task
+        task.add_done_callback(lambda _: _inflight_syncs.pop(key, None))
+    # Shield so one cancelled caller doesn't cancel the shared sync
+    await asyncio.shield(task)
+    return repo_id
+
 
+async def _analyze_repo(repo_url: str, repo_id: str, store) -> None:
+    """Ask Bob's Brain to analyze a repo and store the resulting profile."""
     # Ask Bob's Brain to analyze the repo
     result = await bob.ask_bob(
-        prompt=f"""
-        Analyze this repository for bounty work preparation:
-        Repo: {repo_url}
-
-        Examine:
-        1. CONTRIBUTING.md - guidelines, CLA requirements
-        2. Recent merged PRs (last 10) - style patterns, commit format
-        3. Code style configs (.eslintrc, pyproject.toml, etc.)
-        4. Test structure and requirements
-        5. Any AGENTS.md or special instructions
-
-        Return as JSON:
-        {{
-            "quick_summary": ["bullet point 1", "bullet point 2", ...],
-            "commands": {{
-                "lint": "<lint command>",
-                "test": "<test command>",
-                "typecheck": "<typecheck command if any>"
-            }},
-            "style_rules": {{
-                "commit_format": "<commit message format>",
-                "casing": "<naming conventions>",
-                "pr_title_format": "<PR title format>"
-            }},
-            "maintainer_preferences": ["preference 1", ...],
-            "gotchas": ["gotcha 1", ...],
-            "cla_required": <boolean>,
-            "links": {{
-                "contributing": "<URL to CONTRIBUTING.md>",
-                "style_guide": "<URL if separate style guide>"
-            }}
-        }}
-        """,
+        prompt=REPO_SYNC_PROMPT.format(repo_url=repo_url),
         context={"purpose": "repo_knowledge_sync"},
     )
 
@@ -92,18 +103,16 @@ async def sync_repo_knowledge(repo_url: str, store) -> str:
         response = {}
 
     # Store in LangGraph Store (persists forever)
-    await store.aput(
-        namespace=("repos", repo_id),
-        key="profile",
-        value={
+    await put_repo_profile(
+        store,
+        repo_id,
+        {
             **response,
             "url": repo_url,
             "last_synced": datetime.now().isoformat(),
         },
     )
 
-    return repo_id
-
 
 async def get_repo_profile(repo_id: str, store) -> Optional[dict]:
     """Get repo profile from store.
@@ -116,6 +125,6 @@ async def get_repo_profile(repo_id: str, store) -> Optional[dict]:
         Repo profile dict or None if not found
     """
     try:
-        return await store.aget(("repos", repo_id), "profile")
+        return await load_repo_profile(store, repo_id)
     except Exception:
         return None
@@ -0,0 +1,41 @@
+"""Compiled workflow graph for the FastAPI server and local runs.
+
+Kept separate from agent.py so the BountyOrchestrator module that Agent
+Engine pickles and re-imports carries no module-level graph.
+
+- get_graph: Process-wide compiled graph (built on first call)
+- graph: Lazy export referenced by langgraph.json
+"""
+
+import functools
+
+from .agent import get_checkpointer, make_workflow
+
+
+def _build_graph():
+    """Build graph for local testing.
+
+    DEPRECATED: Use BountyOrchestrator class for Agent Engine deployment.
+    """
+    return make_workflow().compile(checkpointer=get_checkpointer())
+
+
+@functools.cache
+def get_graph():
+    """Get the compiled graph, building it on first call only.
+
+    The result is a process-wide singleton, so importing this module never
+    compiles the graph or opens a checkpointer connection.
+    """
+    return _build_graph()
+
+
+def __getattr__(name: str):
+    """Resolve the legacy ``graph`` export lazily (PEP 562).
+
+    langgraph.json references ``local_graph.py:graph``; the graph is only
+    built when that attribute is first accessed.
+    """
+    if name == "graph":
+        return get_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
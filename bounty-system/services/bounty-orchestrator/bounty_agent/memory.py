@@ -13,12 +13,21 @@ Namespaces:
 - ("learnings", "rejections"): Lessons from rejected PRs (semantic searchable)
 - ("learnings", "successes"): What worked well (semantic searchable)
 - ("users", "<user_id>"): User preferences and settings
+- ("repo_index",) / ("bounty_index",): Per-item list summaries, written
+  alongside every profile/state so list views never load full records
 """
 
+import asyncio
+import functools
 import logging
 import os
 from typing import Any, Dict, List, Optional, Tuple
 
+from langchain_core.embeddings import Embeddings
+from langgraph.store.base import PutOp, SearchItem
+
+from .cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
 # Namespace constants for consistent access
@@ -26,13 +35,120 @@ NAMESPACE_REPOS = ("repos",)
 NAMESPACE_BOUNTIES = ("bounties",)
 NAMESPACE_LEARNINGS = ("learnings",)
 NAMESPACE_USERS = ("users",)
+NAMESPACE_REPO_INDEX = ("repo_index",)
+NAMESPACE_BOUNTY_INDEX = ("bounty_index",)
+
+
+# Per-item namespaces are built on every store call; memoize them so hot
+# paths reuse one tuple per id instead of allocating a new one each time
+@functools.lru_cache(maxsize=4096)
+def _repo_ns(repo_id: str) -> Tuple[str, str]:
+    return (*NAMESPACE_REPOS, repo_id)
+
+
+@functools.lru_cache(maxsize=4096)
+def _bounty_ns(bounty_id: str) -> Tuple[str, str]:
+    return (*NAMESPACE_BOUNTIES, bounty_id)
+
+
+@functools.lru_cache(maxsize=16)
+def _learnings_ns(category: str) -> Tuple[str, str]:
+    return (*NAMESPACE_LEARNINGS, category)
+
+
+@functools.lru_cache(maxsize=1024)
+def _user_ns(user_id: str) -> Tuple[str, str]:
+    return (*NAMESPACE_USERS, user_id)
+
+
+# Repo profiles are read several times per workflow (analyze, status,
+# outcome recording) but change only on sync. Keyed by (store, repo_id);
+# put_repo_profile drops the entry it overwrites.
+REPO_PROFILE_CACHE_TTL = float(os.environ.get("REPO_PROFILE_CACHE_TTL", "60"))
+_profile_cache = TTLCache(ttl=REPO_PROFILE_CACHE_TTL, maxsize=512)
+
+# Learning searches repeat per repo (every analyze run for a repo asks the
+# same query) and each costs an embedding call plus an HNSW scan. Keyed by
+# (store, namespace, query, limit); put_learning drops the store's entries.
+LEARNINGS_SEARCH_CACHE_TTL = float(os.environ.get("LEARNINGS_SEARCH_CACHE_TTL", "300"))
+_search_cache = TTLCache(ttl=LEARNINGS_SEARCH_CACHE_TTL, maxsize=512)
+
+# Shallow-merges a JSON patch into one store row (prefix is the namespace
+# joined with ".", as langgraph's Postgres store keys rows)
+_PATCH_VALUE_SQL = (
+    "UPDATE store SET value = value || %s, updated_at = CURRENT_TIMESTAMP "
+    "WHERE prefix = %s AND key = %s"
+)
+
+# Value fields the Postgres store embeds for semantic search
+EMBEDDED_FIELDS = ("text", "embedding_text")
+
+# text-embedding-004 dimensions
+EMBEDDING_DIMS = 768
+
+# Learnings search first takes this many nearest neighbours by Hamming
+# distance on binary-quantized embeddings, then re-ranks them exactly. The
+# HNSW scan returns at most hnsw.ef_search rows (HNSW_EF_SEARCH, set per
+# connection in db.get_pool()), so keep that at least this large.
+RERANK_CANDIDATES = int(os.environ.get("LEARNINGS_RERANK_CANDIDATES", "50"))
+
+# pgvector HNSW build parameters for the learnings embedding index
+HNSW_M = int(os.environ.get("HNSW_M", "24"))
+HNSW_EF_CONSTRUCTION = int(os.environ.get("HNSW_EF_CONSTRUCTION", "128"))
+
+# Dev-mode store, shared so data written by one request is visible to the next
+_memory_store = None
+
+# Production store, built once per connection pool. Constructing it also
+# creates the embeddings client, so it must not happen per call.
+_postgres_store = None
+_postgres_store_pool = None
+
+
+class _LazyVertexEmbeddings(Embeddings):
+    """VertexAIEmbeddings built on first use instead of at store creation.
+
+    Importing langchain_google_vertexai and constructing the client (auth,
+    transport setup) is slow, and get_store() runs during startup. Deferring
+    it moves that cost off cold start; the one client is then reused, with
+    its connection, for every later embed call.
+    """
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self._client: Optional[Embeddings] = None
+
+    @property
+    def client(self) -> Embeddings:
+        if self._client is None:
+            from langchain_google_vertexai import VertexAIEmbeddings
+
+            self._client = VertexAIEmbeddings(model_name=self.model_name)
+        return self._client
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.client.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.client.embed_query(text)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.client.aembed_documents(texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await self.client.aembed_query(text)
 
 
 def get_store():
     """Get production LangGraph Store with semantic search.
 
-    Uses PostgreSQL + pgvector for cross-session memory.
-    Falls back to in-memory store for development.
+    Uses PostgreSQL + pgvector for cross-session memory, sharing the
+    process-wide connection pool with the checkpointer. Must be called from
+    a running event loop when DATABASE_URL is set.
+    Falls back to a process-wide InMemoryStore for development, which has
+    the same async interface so callers never special-case dev mode. Either
+    way the store is built once and reused, so calling this per request is
+    cheap.
 
     Returns:
         LangGraph Store instance
@@ -40,31 +156,55 @@ def get_store():
     database_url = os.environ.get("DATABASE_URL")
 
     if not database_url:
-        # Dev fallback - warn loudly
-        logger.warning(
-            "DATABASE_URL not set - using in-memory store (data will be lost)"
-        )
-        from langgraph.store.memory import InMemoryStore
+        global _memory_store
+        if _memory_store is None:
+            # Dev fallback - warn loudly
+            logger.warning(
+                "DATABASE_URL not set - using in-memory store (data will be lost)"
+            )
+            from langgraph.store.memory import InMemoryStore
 
-        return InMemoryStore()
+            _memory_store = InMemoryStore()
+        return _memory_store
 
     # Production: PostgreSQL with Vertex AI embeddings for semantic search
+    global _postgres_store, _postgres_store_pool
     try:
-        from langchain_google_vertexai import VertexAIEmbeddings
-        from langgraph.store.postgres import PostgresStore
+        from langgraph.store.postgres.aio import AsyncPostgresStore
+
+        from .db import get_pool
+
+        pool = get_pool()
+        if _postgres_store is not None and _postgres_store_pool is pool:
+            return _postgres_store
 
-        embeddings = VertexAIEmbeddings(model_name="text-embedding-004")
+        embeddings = _LazyVertexEmbeddings(model_name="text-embedding-004")
 
-        store = PostgresStore(
-            connection_string=database_url,
+        store = AsyncPostgresStore(
+            pool,
             index={
-                "dims": 768,  # text-embedding-004 dimensions
+                "dims": EMBEDDING_DIMS,
                 "embed": embeddings,
-                "fields": ["text", "embedding_text"],  # Fields to embed
+                "fields": list(EMBEDDED_FIELDS),
+                "distance_type": "cosine",
+                # Denser graph than pgvector's m=16/ef_construction=64 for
+                # better recall as learnings grow. Applied when setup()
+                # creates the index; query-time ef_search is set per
+                # connection in db.get_pool(). halfvec stores 2 bytes per
+                # dimension, halving index size and the bytes each distance
+                # scan reads (databases created before this: see
+                # scripts/db/setup.py).
+                "ann_index_config": {
+                    "kind": "hnsw",
+                    "vector_type": "halfvec",
+                    "m": HNSW_M,
+                    "ef_construction": HNSW_EF_CONSTRUCTION,
+                },
             },
         )
 
         logger.info("Initialized PostgresStore with pgvector semantic search")
+        _postgres_store, _postgres_store_pool = store, pool
         return store
 
     except ImportError as e:
@@ -75,6 +215,312 @@ def get_store():
         raise
 
 
+def repo_summary(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields of a repo profile shown in list views."""
+    return {
+        "summary": profile.get("quick_summary", []),
+        "url": profile.get("url", ""),
+        "links": profile.get("links", {}),
+        "last_synced": profile.get("last_synced"),
+    }
+
+
+# Profile field -> repo_index summary field it feeds (see repo_summary)
+_REPO_SUMMARY_SOURCES = {
+    "quick_summary": "summary",
+    "url": "url",
+    "links": "links",
+    "last_synced": "last_synced",
+}
+
+
+def bounty_summary(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields of a bounty state shown in list views."""
+    return {
+        "issue_summary": state.get("issue_summary", ""),
+        "phase": state.get("phase", ""),
+        "repo_id": state.get("repo_id", ""),
+        "outcome": state.get("outcome"),
+    }
+
+
+def _learning_value(
+    category: str, repo: str, description: str, lesson: str
+) -> Dict[str, Any]:
+    """Build the stored value for a learning."""
+    return {
+        "repo": repo,
+        "what_happened": description,
+        "lesson": lesson,
+        # This field is embedded for semantic search
+        "embedding_text": f"{repo} {category} {lesson}",
+    }
+
+
+def _learning_items(
+    category: str, items: List[Dict[str, str]]
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """(key, value) pairs for record_learning-style item dicts."""
+    return [
+        (
+            f"learn_{item['learning_id']}",
+            _learning_value(
+                category, item["repo"], item["description"], item["lesson"]
+            ),
+        )
+        for item in items
+    ]
+
+
+async def load_repo_profile(store, repo_id: str) -> Optional[Dict[str, Any]]:
+    """Read a repo profile through the short-lived profile cache.
+
+    Callers must not mutate the returned dict; it is shared with later reads.
+    """
+
+    async def load():
+        item = await store.aget(_repo_ns(repo_id), "profile")
+        return item.value if item else None
+
+    return await _profile_cache.get_or_load((store, repo_id), load)
+
+
+async def put_repo_profile(store, repo_id: str, profile: Dict[str, Any]) -> None:
+    """Write a repo profile and its list summary in one store batch."""
+    try:
+        await store.abatch(
+            [
+                PutOp(_repo_ns(repo_id), "profile", profile),
+                PutOp(
+                    NAMESPACE_REPO_INDEX, repo_id, repo_summary(profile), index=False
+                ),
+            ]
+        )
+    finally:
+        _profile_cache.invalidate((store, repo_id))
+
+
+def _has_pool(store) -> bool:
+    """Whether store is the Postgres store (backed by a connection pool)."""
+    return hasattr(getattr(store, "conn", None), "connection")
+
+
+async def update_repo_profile_fields(
+    store, repo_id: str, fields: Dict[str, Any]
+) -> None:
+    """Merge fields into a stored repo profile (no-op if there is none).
+
+    On Postgres the profile and its list summary are patched in place with
+    jsonb ``||``, so the full profile is neither read back nor resent, and
+    nothing is re-embedded. Updates touching an embedded field, and stores
+    without a pool, fall back to a read-merge-write.
+    """
+    try:
+        if _has_pool(store) and not set(fields) & set(EMBEDDED_FIELDS):
+            from psycopg.types.json import Jsonb
+
+            summary = {
+                _REPO_SUMMARY_SOURCES[name]: value
+                for name, value in fields.items()
+                if name in _REPO_SUMMARY_SOURCES
+            }
+            async with store.conn.connection() as conn, conn.transaction():
+                await conn.execute(
+                    _PATCH_VALUE_SQL, (Jsonb(fields), f"repos.{repo_id}", "profile")
+                )
+                if summary:
+                    await conn.execute(
+                        _PATCH_VALUE_SQL, (Jsonb(summary), "repo_index", repo_id)
+                    )
+            return
+
+        item = await store.aget(_repo_ns(repo_id), "profile")
+        if item is not None:
+            await put_repo_profile(store, repo_id, {**item.value, **fields})
+    finally:
+        _profile_cache.invalidate((store, repo_id))
+
+
+async def put_learning(store, category: str, key: str, value: Dict[str, Any]) -> None:
+    """Write a learning and drop cached learning searches for the store."""
+    try:
+        await store.aput(_learnings_ns(category), key, value)
+    finally:
+        _search_cache.invalidate((store,))
+
+
+async def put_learnings(
+    store, category: str, items: List[Tuple[str, Dict[str, Any]]]
+) -> None:
+    """Write several (key, value) learnings in one batch.
+
+    The store embeds every item's text in a single embeddings request and
+    writes them in one round-trip, instead of one of each per learning.
+    """
+    if not items:
+        return
+    namespace = _learnings_ns(category)
+    try:
+        await store.abatch([PutOp(namespace, key, value) for key, value in items])
+    finally:
+        _search_cache.invalidate((store,))
+
+
+# Staging tables for bulk_load_learnings, dropped at commit. COPY can't
+# upsert, so rows are copied here and merged with INSERT ... ON CONFLICT.
+# One statement per execute: the pool prepares every query
+# (prepare_threshold=0), and a prepared statement can't hold several.
+_LOAD_TABLES_SQL = (
+    """
+CREATE TEMP TABLE load_store (prefix text, key text, value jsonb)
+    ON COMMIT DROP
+""",
+    f"""
+CREATE TEMP TABLE load_vectors (
+    prefix text, key text, field_name text, embedding halfvec({EMBEDDING_DIMS})
+) ON COMMIT DROP
+""",
+)
+
+_MERGE_LOADED_SQL = (
+    """
+INSERT INTO store (prefix, key, value)
+SELECT prefix, key, value FROM load_store
+ON CONFLICT (prefix, key) DO UPDATE
+SET value = EXCLUDED.value, updated_at = CURRENT_TIMESTAMP
+""",
+    """
+INSERT INTO store_vectors (prefix, key, field_name, embedding)
+SELECT prefix, key, field_name, embedding FROM load_vectors
+ON CONFLICT (prefix, key, field_name) DO UPDATE
+SET embedding = EXCLUDED.embedding, updated_at = CURRENT_TIMESTAMP
+""",
+)
+
+
+async def bulk_load_learnings(
+    store, category: str, items: List[Tuple[str, Dict[str, Any]]]
+) -> None:
+    """Import many (key, value) learnings at once, e.g. historical backfills.
+
+    On Postgres all texts are embedded in one request and the rows are
+    streamed with COPY into staging tables, then merged into the store's
+    tables in the same transaction, instead of one INSERT per row. Keys
+    must be unique within items. Other stores use put_learnings.
+    """
+    if not items:
+        return
+    if not _has_pool(store):
+        await put_learnings(store, category, items)
+        return
+
+    from psycopg.types.json import Jsonb
+
+    prefix = ".".join(_learnings_ns(category))
+    to_embed = [
+        (key, field, value[field])
+        for key, value in items
+        for field in EMBEDDED_FIELDS
+        if isinstance(value.get(field), str)
+    ]
+    vectors = await store.embeddings.aembed_documents([text for _, _, text in to_embed])
+
+    try:
+        async with store.conn.connection() as conn, conn.transaction():
+            for statement in _LOAD_TABLES_SQL:
+                await conn.execute(statement)
+            async with conn.cursor() as cur:
+                async with cur.copy(
+                    "COPY load_store (prefix, key, value) FROM STDIN"
+                ) as copy:
+                    for key, value in items:
+                        await copy.write_row((prefix, key, Jsonb(value)))
+                async with cur.copy(
+                    "COPY load_vectors (prefix, key, field_name, embedding) "
+                    "FROM STDIN"
+                ) as copy:
+                    for (key, field, _), vector in zip(to_embed, vectors):
+                        await copy.write_row(
+                            (prefix, key, field, f"[{','.join(map(str, vector))}]")
+                        )
+            for statement in _MERGE_LOADED_SQL:
+                await conn.execute(statement)
+    finally:
+        _search_cache.invalidate((store,))
+    logger.info(f"Bulk loaded {len(items)} learnings ({category})")
+
+
+async def put_bounty_state(store, bounty_id: str, state: Dict[str, Any]) -> None:
+    """Write a bounty state and its list summary in one store batch."""
+    await store.abatch(
+        [
+            PutOp(_bounty_ns(bounty_id), "state", state),
+            PutOp(
+                NAMESPACE_BOUNTY_INDEX, bounty_id, bounty_summary(state), index=False
+            ),
+        ]
+    )
+
+
+# Stage one walks store_vectors_binary_idx (see db.STORE_INDEXES): 1 bit
+# per dimension, compared with XOR + popcount. Stage two re-ranks those
+# candidates by exact cosine distance on the halfvec embeddings. An item
+# embedded on several fields ranks by its closest one. The re-rank runs in
+# the same statement, next to the vectors: scoring the candidates in
+# Python instead would need no fewer round-trips, and would ship every
+# candidate's embedding (~1.5 KB each) to the client.
+_RERANK_SEARCH_SQL = f"""
+WITH candidates AS (
+    SELECT prefix, key, embedding
+    FROM store_vectors
+    WHERE prefix LIKE %(prefix)s
+    ORDER BY binary_quantize(embedding)::bit({EMBEDDING_DIMS})
+        <~> binary_quantize(%(vector)s::halfvec({EMBEDDING_DIMS}))
+    LIMIT %(candidates)s
+)
+SELECT s.prefix, s.key, s.value, s.created_at, s.updated_at,
+    1 - min(c.embedding <=> %(vector)s::halfvec({EMBEDDING_DIMS})) AS score
+FROM candidates c
+JOIN store s ON s.prefix = c.prefix AND s.key = c.key
+GROUP BY s.prefix, s.key
+ORDER BY score DESC
+LIMIT %(limit)s
+"""
+
+
+async def _search_reranked(
+    store,
+    namespace: Tuple[str, ...],
+    query: str,
+    limit: int,
+) -> List[SearchItem]:
+    """Two-stage semantic search on Postgres: binary HNSW, exact re-rank."""
+    candidates = max(RERANK_CANDIDATES, limit)
+    vector = await store.embeddings.aembed_query(query)
+    params = {
+        "prefix": f"{'.'.join(namespace)}%",
+        "vector": f"[{','.join(map(str, vector))}]",
+        "candidates": candidates,
+        "limit": limit,
+    }
+
+    async with store.conn.connection() as conn:
+        cur = await conn.execute(_RERANK_SEARCH_SQL, params)
+        rows = await cur.fetchall()
+
+    return [
+        SearchItem(
+            namespace=tuple(row["prefix"].split(".")),
+            key=row["key"],
+            value=row["value"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            score=float(row["score"]),
+        )
+        for row in rows
+    ]
+
+
 class MemoryManager:
     """High-level interface for bounty orchestrator memory operations.
 
@@ -107,11 +553,7 @@ class MemoryManager:
             Repo profile dict or None if not found
         """
         try:
-            result = await self.store.aget(
-                namespace=(*NAMESPACE_REPOS, repo_id),
-                key="profile",
-            )
-            return result.value if result else None
+            return await load_repo_profile(self.store, repo_id)
         except Exception as e:
             logger.error(f"Failed to get repo profile {repo_id}: {e}")
             return None
@@ -128,20 +570,32 @@ class MemoryManager:
                 - gotchas: List of known issues
                 - last_synced: ISO timestamp
         """
-        await self.store.aput(
-            namespace=(*NAMESPACE_REPOS, repo_id),
-            key="profile",
-            value=profile,
-        )
+        await put_repo_profile(self.store, repo_id, profile)
         logger.info(f"Saved repo profile: {repo_id}")
 
-    async def list_repos(self) -> List[Tuple[str, Dict[str, Any]]]:
+    async def update_repo_profile_fields(
+        self, repo_id: str, fields: Dict[str, Any]
+    ) -> None:
+        """Update some fields of a repo profile without rewriting all of it.
+
+        Args:
+            repo_id: Unique repo identifier
+            fields: Top-level profile fields to set
+        """
+        await update_repo_profile_fields(self.store, repo_id, fields)
+
+    async def list_repos(self, limit: int = 1000) -> List[Tuple[str, Dict[str, Any]]]:
         """List all tracked repos.
 
+        Reads the repo_index summaries rather than the full profiles.
+
+        Args:
+            limit: Maximum number of repos to return
+
         Returns:
-            List of (repo_id, profile) tuples
+            List of (repo_id, summary) tuples (see repo_summary)
         """
-        results = await self.store.alist(namespace=NAMESPACE_REPOS)
+        results = await self.store.asearch(NAMESPACE_REPO_INDEX, limit=limit)
         return [(r.key, r.value) for r in results]
 
     # ==========================================
@@ -159,7 +613,7 @@ class MemoryManager:
         """
         try:
             result = await self.store.aget(
-                namespace=(*NAMESPACE_BOUNTIES, bounty_id),
+                namespace=_bounty_ns(bounty_id),
                 key="state",
             )
             return result.value if result else None
@@ -167,9 +621,7 @@ class MemoryManager:
             logger.error(f"Failed to get bounty state {bounty_id}: {e}")
             return None
 
-    async def save_bounty_state(
-        self, bounty_id: str, state: Dict[str, Any]
-    ) -> None:
+    async def save_bounty_state(self, bounty_id: str, state: Dict[str, Any]) -> None:
         """Save or update bounty workflow state.
 
         Args:
@@ -183,12 +635,26 @@ class MemoryManager:
                 - implementation: Implementation state
                 - checkpoint_id: LangGraph checkpoint reference
         """
-        await self.store.aput(
-            namespace=(*NAMESPACE_BOUNTIES, bounty_id),
-            key="state",
-            value=state,
+        await put_bounty_state(self.store, bounty_id, state)
+        logger.info(
+            f"Saved bounty state: {bounty_id} (phase: {state.get('phase', '?')})"
         )
-        logger.info(f"Saved bounty state: {bounty_id} (phase: {state.get('phase', '?')})")
+
+    async def list_bounties(
+        self, limit: int = 1000
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """List all tracked bounties.
+
+        Reads the bounty_index summaries rather than the full states.
+
+        Args:
+            limit: Maximum number of bounties to return
+
+        Returns:
+            List of (bounty_id, summary) tuples (see bounty_summary)
+        """
+        results = await self.store.asearch(NAMESPACE_BOUNTY_INDEX, limit=limit)
+        return [(b.key, b.value) for b in results]
 
     async def list_bounties_by_phase(self, phase: str) -> List[Dict[str, Any]]:
         """List bounties by workflow phase.
@@ -199,12 +665,35 @@ class MemoryManager:
         Returns:
             List of bounty states matching the phase
         """
-        all_bounties = await self.store.alist(namespace=NAMESPACE_BOUNTIES)
-        return [
-            {"id": b.key, **b.value}
-            for b in all_bounties
-            if b.value.get("phase") == phase
-        ]
+        # Filtered in the store (value->'phase' = ..., backed by
+        # store_value_phase_idx in Postgres) rather than loading every state
+        bounties = await self.store.asearch(
+            NAMESPACE_BOUNTIES, filter={"phase": phase}, limit=1000
+        )
+        return [{"id": b.namespace[-1], **b.value} for b in bounties]
+
+    async def backfill_indexes(self) -> None:
+        """Build missing list indexes from full repo/bounty records.
+
+        Profiles and states written before the indexes existed have no
+        summary entry. Runs only while an index is still empty.
+        """
+        sources = (
+            (NAMESPACE_REPO_INDEX, NAMESPACE_REPOS, "profile", repo_summary),
+            (NAMESPACE_BOUNTY_INDEX, NAMESPACE_BOUNTIES, "state", bounty_summary),
+        )
+        for index_ns, source_ns, key, summarize in sources:
+            if await self.store.asearch(index_ns, limit=1):
+                continue
+            items = await self.store.asearch(source_ns, limit=10000)
+            ops = [
+                PutOp(index_ns, item.namespace[-1], summarize(item.value), index=False)
+                for item in items
+                if item.key == key
+            ]
+            if ops:
+                await self.store.abatch(ops)
+                logger.info(f"Backfilled {len(ops)} entries into {index_ns[0]}")
 
     # ==========================================
     # Learning Operations (Semantic Searchable)
@@ -227,24 +716,52 @@ class MemoryManager:
             description: What happened
             lesson: The key takeaway
         """
-        await self.store.aput(
-            namespace=(*NAMESPACE_LEARNINGS, category),
-            key=f"learn_{learning_id}",
-            value={
-                "repo": repo,
-                "what_happened": description,
-                "lesson": lesson,
-                # This field is embedded for semantic search
-                "embedding_text": f"{repo} {category} {lesson}",
-            },
+        await put_learning(
+            self.store,
+            category,
+            f"learn_{learning_id}",
+            _learning_value(category, repo, description, lesson),
         )
         logger.info(f"Recorded learning ({category}): {lesson[:50]}...")
 
+    async def record_learnings_batch(
+        self, category: str, items: List[Dict[str, str]]
+    ) -> None:
+        """Record several learnings with one embedding call and one write.
+
+        Args:
+            category: "rejections" or "successes"
+            items: Dicts with the record_learning fields (learning_id, repo,
+                description, lesson)
+        """
+        await put_learnings(self.store, category, _learning_items(category, items))
+        logger.info(f"Recorded {len(items)} learnings ({category})")
+
+    async def bulk_load_learnings(
+        self, category: str, items: List[Dict[str, str]]
+    ) -> None:
+        """Import many learnings at once (COPY-based on Postgres).
+
+        Args:
+            category: "rejections" or "successes"
+            items: Dicts with the record_learning fields (learning_id, repo,
+                description, lesson); learning_ids must be unique
+        """
+        await bulk_load_learnings(
+            self.store, category, _learning_items(category, items)
+        )
+
     async def search_learnings(
         self, query: str, category: Optional[str] = None, limit: int = 5
     ) -> List[Dict[str, Any]]:
         """Semantic search over past learnings.
 
+        On Postgres a query is answered in two stages, a Hamming-distance
+        HNSW scan over binary-quantized embeddings then an exact cosine
+        re-rank of the top candidates. An empty query skips embedding and
+        lists the namespace, most recently updated first (score is then
+        None). Results are cached briefly; callers must not mutate them.
+
         Args:
             query: Search query (natural language)
             category: Optional filter ("rejections" or "successes")
@@ -255,14 +772,23 @@ class MemoryManager:
         """
         namespace = NAMESPACE_LEARNINGS
         if category:
-            namespace = (*NAMESPACE_LEARNINGS, category)
-
-        results = await self.store.asearch(
-            namespace=namespace,
-            query=query,
-            limit=limit,
+            namespace = _learnings_ns(category)
+
+        async def search():
+            if query and _has_pool(self.store):
+                results = await _search_reranked(self.store, namespace, query, limit)
+            else:
+                # Dev InMemoryStore, or a plain listing
+                results = await self.store.asearch(
+                    namespace,
+                    query=query or None,
+                    limit=limit,
+                )
+            return [{"score": r.score, **r.value} for r in results]
+
+        return await _search_cache.get_or_load(
+            (self.store, namespace, query, limit), search
         )
-        return [{"score": r.score, **r.value} for r in results]
 
     async def get_repo_gotchas(self, repo_id: str) -> List[str]:
         """Get gotchas for a repo, including learned ones.
@@ -279,23 +805,26 @@ class MemoryManager:
         """
         gotchas = []
 
-        # Get static gotchas from profile
-        profile = await self.get_repo_profile(repo_id)
+        # Static gotchas from the profile and learned gotchas from
+        # rejections are independent reads; fetch them together
+        repo_name = repo_id.replace("_", "/").replace("github/com/", "")
+        profile, learnings = await asyncio.gather(
+            self.get_repo_profile(repo_id),
+            self.search_learnings(
+                query=f"rejection {repo_name}",
+                category="rejections",
+                limit=3,
+            ),
+        )
         if profile:
             gotchas.extend(profile.get("gotchas", []))
 
-        # Search for learned gotchas from rejections
-        repo_name = repo_id.replace("_", "/").replace("github/com/", "")
-        learnings = await self.search_learnings(
-            query=f"rejection {repo_name}",
-            category="rejections",
-            limit=3,
-        )
         for learning in learnings:
             if learning.get("lesson"):
                 gotchas.append(learning["lesson"])
 
-        return list(set(gotchas))  # Deduplicate
+        # Deduplicate, keeping first-seen order so prompts are deterministic
+        return list(dict.fromkeys(gotchas))
 
     # ==========================================
     # User Preferences
@@ -311,7 +840,7 @@ class MemoryManager:
             User preferences dict or None
         """
         result = await self.store.aget(
-            namespace=(*NAMESPACE_USERS, user_id),
+            namespace=_user_ns(user_id),
             key="preferences",
         )
         return result.value if result else None
@@ -329,7 +858,7 @@ class MemoryManager:
                 - notification_preferences: Email/Slack settings
         """
         await self.store.aput(
-            namespace=(*NAMESPACE_USERS, user_id),
+            namespace=_user_ns(user_id),
             key="preferences",
             value=preferences,
         )
@@ -1,12 +1,15 @@
 """Analyze bounty node - asks Bob to analyze the opportunity."""
 
+import asyncio
 import logging
+from typing import Dict, Set, Tuple
 
 from ..state import BountyState
 from ..bobs_brain_client import bob
 from ..prompts.analyze import ANALYZE_PROMPT
 from ..memory import MemoryManager, get_store
 from ..knowledge import sync_repo_knowledge, is_stale
+from .plan import start_speculative_plan
 
 logger = logging.getLogger(__name__)
 
@@ -22,41 +25,74 @@ def _get_memory():
     return _memory_manager
 
 
-async def analyze_bounty(state: BountyState) -> BountyState:
+# Formatted repo context by profile object. load_repo_profile returns the
+# same cached dict for every bounty in a repo and profiles are replaced,
+# not mutated, on update, so identity is a safe key. The profile is kept
+# in the entry so its id can't be reused while cached.
+_repo_context_cache: Dict[int, Tuple[dict, str]] = {}
+REPO_CONTEXT_CACHE_SIZE = 128
+
+# Strong references to background repo refreshes until they finish
+_background_syncs: Set[asyncio.Task] = set()
+
+
+async def _search_learnings(memory: MemoryManager, repo: str) -> list:
+    """Semantic search for learnings relevant to a repo (empty on failure)."""
+    try:
+        return await memory.search_learnings(query=f"bounty {repo}", limit=3)
+    except Exception as e:
+        logger.warning(f"Failed to search learnings: {e}")
+        return []
+
+
+def _refresh_in_background(repo_url: str, store) -> None:
+    """Start a repo knowledge sync without waiting for it."""
+
+    async def refresh():
+        try:
+            await sync_repo_knowledge(repo_url, store, force=True)
+        except Exception as e:
+            logger.warning(f"Failed to refresh repo knowledge: {e}")
+
+    task = asyncio.create_task(refresh())
+    _background_syncs.add(task)
+    task.add_done_callback(_background_syncs.discard)
+
+
+async def analyze_bounty(state: BountyState) -> dict:
     """Ask Bob to analyze the bounty opportunity.
 
     This node:
-    1. Loads repo knowledge from long-term memory (syncs if stale)
-    2. Searches for relevant past learnings
-    3. Generates a context-rich prompt for Bob
-    4. Sends to Bob's Brain for execution
+    1. Loads repo knowledge and semantically similar past learnings from
+       long-term memory concurrently (syncs if missing, refreshes in the
+       background if stale)
+    2. Generates a context-rich prompt for Bob
+    3. Sends to Bob's Brain for execution
     """
     memory = _get_memory()
     store = get_store()
 
-    # Load repo profile from long-term memory
+    # Load repo profile and relevant learnings from long-term memory together
     repo_id = state["repo_id"]
-    repo_profile = await memory.get_repo_profile(repo_id)
+    repo_profile, learnings = await asyncio.gather(
+        memory.get_repo_profile(repo_id),
+        _search_learnings(memory, state["repo"]),
+    )
 
-    # Sync repo knowledge if missing or stale
-    if not repo_profile or is_stale(repo_profile.get("last_synced")):
+    # Sync repo knowledge if missing; refresh it in the background if stale
+    repo_url = f"https://github.com/{state['repo']}"
+    if not repo_profile:
         logger.info(f"Syncing repo knowledge for {state['repo']}")
         try:
-            repo_url = f"https://github.com/{state['repo']}"
-            await sync_repo_knowledge(repo_url, store)
+            # The profile was just found missing; skip the freshness re-read
+            await sync_repo_knowledge(repo_url, store, force=True)
             repo_profile = await memory.get_repo_profile(repo_id)
         except Exception as e:
             logger.warning(f"Failed to sync repo knowledge: {e}")
-
-    # Search for relevant learnings (semantic search)
-    learnings = []
-    try:
-        learnings = await memory.search_learnings(
-            query=f"bounty {state['repo']}",
-            limit=3,
-        )
-    except Exception as e:
-        logger.warning(f"Failed to search learnings: {e}")
+    elif is_stale(repo_profile.get("last_synced")):
+        # The stale profile is still useful context; don't make Bob wait
+        logger.info(f"Refreshing repo knowledge for {state['repo']}")
+        _refresh_in_background(repo_url, store)
 
     # Build enhanced prompt with memory context
     prompt = ANALYZE_PROMPT.format(
@@ -86,43 +122,64 @@ async def analyze_bounty(state: BountyState) -> BountyState:
         session_id=state["session_id"],
     )
 
-    # Update state with analysis results
-    return {
-        **state,
+    # Return only the keys this node owns; it runs alongside check_competition
+    update = {
         "issue_details": result.get("response", {}),
         "repo_profile": repo_profile,  # Store for later nodes
         "phase": "B",  # Move to Issue Analysis phase
     }
 
+    # Plan while the competition check finishes; create_plan picks it up
+    start_speculative_plan({**state, **update})
+    return update
+
 
 def _format_repo_context(profile: dict) -> str:
-    """Format repo profile for prompt inclusion."""
-    lines = []
+    """Format repo profile for prompt inclusion (memoized per profile)."""
+    entry = _repo_context_cache.get(id(profile))
+    if entry is not None and entry[0] is profile:
+        return entry[1]
+
+    context = _render_repo_context(profile)
+    if len(_repo_context_cache) >= REPO_CONTEXT_CACHE_SIZE:
+        # Evict the oldest entry
+        del _repo_context_cache[next(iter(_repo_context_cache))]
+    _repo_context_cache[id(profile)] = (profile, context)
+    return context
+
+
+def _render_repo_context(profile: dict) -> str:
+    """Build the repo context text, one joined block per section."""
+    sections = []
 
     # Quick summary bullets
     if profile.get("quick_summary"):
-        for point in profile["quick_summary"]:
-            lines.append(f"• {point}")
+        sections.append("\n".join(f"• {point}" for point in profile["quick_summary"]))
 
     # Commands
     if profile.get("commands"):
-        lines.append("\nCommands:")
-        for name, cmd in profile["commands"].items():
-            lines.append(f"  {name}: {cmd}")
+        sections.append(
+            "\nCommands:\n"
+            + "\n".join(f"  {name}: {cmd}" for name, cmd in profile["commands"].items())
+        )
 
     # Style rules
     if profile.get("style_rules"):
-        lines.append("\nStyle Rules:")
-        for rule, value in profile["style_rules"].items():
-            lines.append(f"  {rule}: {value}")
+        sections.append(
+            "\nStyle Rules:\n"
+            + "\n".join(
+                f"  {rule}: {value}" for rule, value in profile["style_rules"].items()
+            )
+        )
 
     # Gotchas
     if profile.get("gotchas"):
-        lines.append("\nGotchas to avoid:")
-        for gotcha in profile["gotchas"]:
-            lines.append(f"  ⚠️ {gotcha}")
+        sections.append(
+            "\nGotchas to avoid:\n"
+            + "\n".join(f"  ⚠️ {gotcha}" for gotcha in profile["gotchas"])
+        )
 
-    return "\n".join(lines)
+    return "\n".join(sections)
 
 
 def _format_learnings(learnings: list) -> str:
@@ -4,9 +4,10 @@ from typing import Literal
 
 from ..state import BountyState
 from ..bobs_brain_client import bob
+from .plan import cancel_speculative_plan
 
 
-async def check_competition(state: BountyState) -> BountyState:
+async def check_competition(state: BountyState) -> dict:
     """Ask Bob to check for competing work on this bounty.
 
     This is a critical gate - if competition exists, we stop.
@@ -31,16 +32,26 @@ async def check_competition(state: BountyState) -> BountyState:
     }}
     """
 
-    result = await bob.ask_bob(
-        prompt=prompt,
-        session_id=state["session_id"],
-    )
+    try:
+        result = await bob.ask_bob(
+            prompt=prompt,
+            session_id=state["session_id"],
+        )
+    except BaseException:
+        # The run stops here too; don't leave the plan call running
+        cancel_speculative_plan(state["session_id"])
+        raise
 
-    return {
-        **state,
+    # Partial update: analyze runs concurrently and owns the other keys
+    update = {
         "competition_analysis": result.get("response", {}),
     }
 
+    # The run ends at the gate; drop the plan analyze is speculating on
+    if should_proceed(update) == "skip":
+        cancel_speculative_plan(state["session_id"])
+    return update
+
 
 def should_proceed(state: BountyState) -> Literal["continue", "skip"]:
     """Routing function - decide if we should proceed based on competition."""
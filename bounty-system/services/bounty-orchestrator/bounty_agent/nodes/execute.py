@@ -5,7 +5,7 @@ from ..bobs_brain_client import bob
 from ..prompts.implement import IMPLEMENT_PROMPT
 
 
-async def execute_via_bob(state: BountyState) -> BountyState:
+async def execute_via_bob(state: BountyState) -> dict:
     """Ask Bob to implement the fix and prepare PR.
 
     This is the main execution node - Bob does the actual work.
@@ -40,7 +40,6 @@ async def execute_via_bob(state: BountyState) -> BountyState:
     )
 
     return {
-        **state,
         "execution_result": result.get("response", {}),
         "phase": "E",  # Move to PR Submission phase
     }
@@ -1,16 +1,101 @@
-"""Plan creation node - asks Bob to create implementation plan."""
+"""Plan creation node - asks Bob to create implementation plan.
 
-from typing import Literal
+Planning only needs the analysis, not the competition check, so analyze
+starts it speculatively (start_speculative_plan) while check_competition
+is still running; create_plan then picks up the finished plan after the
+gate. LangGraph runs a superstep's nodes to completion before the next
+step starts, so this overlap can't be expressed as graph edges. A "skip"
+from the competition check cancels the speculative call.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Literal, Optional, Union
 
 from ..state import BountyState
 from ..bobs_brain_client import bob
 
+logger = logging.getLogger(__name__)
+
+# Marks a session whose competition check said skip before analyze could
+# start the plan, so it isn't started at all
+_SKIPPED = object()
+
+# Speculative plan calls by session_id, removed when consumed or
+# cancelled. Bounded for runs that fail before either happens.
+_speculative_plans: Dict[str, Union[asyncio.Task, object]] = {}
+SPECULATIVE_PLAN_LIMIT = 256
+
+
+def start_speculative_plan(state: BountyState) -> None:
+    """Start asking Bob for the plan before the competition gate.
+
+    Args:
+        state: Bounty state including analyze's issue_details
+    """
+    session_id = state["session_id"]
+    previous = _speculative_plans.pop(session_id, None)
+    if previous is _SKIPPED:
+        return
+    if isinstance(previous, asyncio.Task):
+        previous.cancel()
+    if len(_speculative_plans) >= SPECULATIVE_PLAN_LIMIT:
+        _discard(_speculative_plans.pop(next(iter(_speculative_plans))))
+    _speculative_plans[session_id] = asyncio.create_task(_ask_for_plan(state))
+
+
+def cancel_speculative_plan(session_id: str) -> None:
+    """Cancel (or pre-empt) the speculative plan for a skipped bounty."""
+    entry = _speculative_plans.pop(session_id, None)
+    if entry is None:
+        # analyze hasn't started the plan yet; make sure it won't
+        if len(_speculative_plans) >= SPECULATIVE_PLAN_LIMIT:
+            _discard(_speculative_plans.pop(next(iter(_speculative_plans))))
+        _speculative_plans[session_id] = _SKIPPED
+    else:
+        _discard(entry)
+
+
+def _discard(entry: Union[asyncio.Task, object]) -> None:
+    """Cancel a registry entry if it is a running plan call."""
+    if isinstance(entry, asyncio.Task):
+        entry.cancel()
+
+
+async def _take_speculative_plan(session_id: str) -> Optional[dict]:
+    """Return the speculative plan result, or None if there isn't one."""
+    entry = _speculative_plans.pop(session_id, None)
+    if not isinstance(entry, asyncio.Task):
+        return None
+    try:
+        return await entry
+    except asyncio.CancelledError:
+        if asyncio.current_task().cancelling():
+            raise
+        return None
+    except Exception as e:
+        logger.warning(f"Speculative plan failed, asking again: {e}")
+        return None
 
-async def create_plan(state: BountyState) -> BountyState:
+
+async def create_plan(state: BountyState) -> dict:
     """Ask Bob to create an implementation plan for this bounty.
 
     Uses the analysis results and repo knowledge to create a detailed plan.
+    Reuses the plan analyze started speculatively when there is one.
     """
+    result = await _take_speculative_plan(state["session_id"])
+    if result is None:
+        result = await _ask_for_plan(state)
+
+    return {
+        "implementation_plan": result.get("response", {}),
+        "phase": "C",  # Move to Claim phase (awaiting approval)
+    }
+
+
+async def _ask_for_plan(state: BountyState) -> dict:
+    """Ask Bob for the implementation plan; returns Bob's raw result."""
     prompt = f"""
     Create an implementation plan for this bounty:
 
@@ -38,7 +123,7 @@ async def create_plan(state: BountyState) -> BountyState:
     }}
     """
 
-    result = await bob.ask_bob(
+    return await bob.ask_bob(
         prompt=prompt,
         context={
             "issue_details": state.get("issue_details", {}),
@@ -47,12 +132,6 @@ async def create_plan(state: BountyState) -> BountyState:
         session_id=state["session_id"],
     )
 
-    return {
-        **state,
-        "implementation_plan": result.get("response", {}),
-        "phase": "C",  # Move to Claim phase (awaiting approval)
-    }
-
 
 def is_approved(state: BountyState) -> Literal["execute", "rejected"]:
     """Routing function - check if human approved execution."""
@@ -2,5 +2,13 @@
 
 from .analyze import ANALYZE_PROMPT
 from .implement import IMPLEMENT_PROMPT
+from .knowledge import REJECTION_LESSON_PROMPT, REPO_SYNC_PROMPT
+from .template import PromptTemplate
 
-__all__ = ["ANALYZE_PROMPT", "IMPLEMENT_PROMPT"]
+__all__ = [
+    "ANALYZE_PROMPT",
+    "IMPLEMENT_PROMPT",
+    "PromptTemplate",
+    "REJECTION_LESSON_PROMPT",
+    "REPO_SYNC_PROMPT",
+]
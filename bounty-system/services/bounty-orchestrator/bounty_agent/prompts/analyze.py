@@ -1,6 +1,8 @@
 """Analysis prompt template."""
 
-ANALYZE_PROMPT = """Analyze this GitHub issue for a bounty opportunity:
+from .template import PromptTemplate
+
+ANALYZE_PROMPT = PromptTemplate("""Analyze this GitHub issue for a bounty opportunity:
 
 Issue URL: {issue_url}
 Repository: {repo}
@@ -43,4 +45,4 @@ Return as JSON:
     "style_notes": "<maintainer style observations>",
     "blockers": [<potential issues>]
 }}
-"""
+""")
@@ -1,6 +1,8 @@
 """Implementation prompt template."""
 
-IMPLEMENT_PROMPT = """Implement a fix for this bounty:
+from .template import PromptTemplate
+
+IMPLEMENT_PROMPT = PromptTemplate("""Implement a fix for this bounty:
 
 Issue: {issue_url}
 Repository: {repo}
@@ -58,4 +60,4 @@ Implement the fix and prepare it for PR submission. Return:
     "lint_passed": <boolean>,
     "tests_passed": <boolean>
 }}
-"""
+""")
@@ -0,0 +1,47 @@
+"""Knowledge sync and learning prompt templates."""
+
+from .template import PromptTemplate
+
+REPO_SYNC_PROMPT = PromptTemplate(
+    """Analyze this repository for bounty work preparation:
+Repo: {repo_url}
+
+Examine:
+1. CONTRIBUTING.md - guidelines, CLA requirements
+2. Recent merged PRs (last 10) - style patterns, commit format
+3. Code style configs (.eslintrc, pyproject.toml, etc.)
+4. Test structure and requirements
+5. Any AGENTS.md or special instructions
+
+Return as JSON:
+{{
+    "quick_summary": ["bullet point 1", "bullet point 2", ...],
+    "commands": {{
+        "lint": "<lint command>",
+        "test": "<test command>",
+        "typecheck": "<typecheck command if any>"
+    }},
+    "style_rules": {{
+        "commit_format": "<commit message format>",
+        "casing": "<naming conventions>",
+        "pr_title_format": "<PR title format>"
+    }},
+    "maintainer_preferences": ["preference 1", ...],
+    "gotchas": ["gotcha 1", ...],
+    "cla_required": <boolean>,
+    "links": {{
+        "contributing": "<URL to CONTRIBUTING.md>",
+        "style_guide": "<URL if separate style guide>"
+    }}
+}}
+"""
+)
+
+REJECTION_LESSON_PROMPT = PromptTemplate("""Our PR was rejected. Extract the key lesson:
+
+Repo: {repo}
+Feedback: {reviewer_feedback}
+
+Return a single clear lesson we should remember for future PRs to this repo.
+Keep it concise (1-2 sentences).
+""")
@@ -0,0 +1,44 @@
+"""Prompt templates parsed once at import.
+
+str.format re-scans the whole template for braces on every call. The
+prompts here are large and rendered on every workflow run, so they are
+split into (literal, field) segments up front and rendered by joining the
+segments with the supplied values.
+"""
+
+from string import Formatter
+from typing import Any, List, Optional, Tuple
+
+
+class PromptTemplate:
+    """A str.format-style template with the parsing done up front.
+
+    Supports named fields and {{ }} escapes; format specs, conversions and
+    positional fields are rejected at construction.
+
+    Usage:
+        PROMPT = PromptTemplate("Repo: {repo}")
+        PROMPT.format(repo="o/r")  # "Repo: o/r"
+    """
+
+    __slots__ = ("template", "_parts")
+
+    def __init__(self, template: str):
+        self.template = template
+        self._parts: List[Tuple[str, Optional[str]]] = []
+        for literal, field, spec, conversion in Formatter().parse(template):
+            if field is not None and (not field.isidentifier() or spec or conversion):
+                raise ValueError(f"Unsupported prompt field: {{{field}}}")
+            self._parts.append((literal, field))
+
+    def format(self, **kwargs: Any) -> str:
+        """Render the template; raises KeyError for a missing field."""
+        out = []
+        for literal, field in self._parts:
+            out.append(literal)
+            if field is not None:
+                out.append(format(kwargs[field]))
+        return "".join(out)
+
+    def __str__(self) -> str:
+        return self.template
@@ -29,3 +29,31 @@ class BountyState(TypedDict):
 
     # Repo knowledge (loaded from store)
     repo_profile: Optional[dict]
+
+
+def new_bounty_state(
+    bounty_id: str,
+    issue_url: str,
+    repo: str,
+    repo_id: str,
+    session_id: str,
+) -> BountyState:
+    """Build the initial state for a new workflow run (phase A).
+
+    A single dict display with constant keys, so CPython builds it in one
+    BUILD_CONST_KEY_MAP step instead of key-by-key insertion.
+    """
+    return {
+        "bounty_id": bounty_id,
+        "issue_url": issue_url,
+        "repo": repo,
+        "repo_id": repo_id,
+        "issue_details": {},
+        "competition_analysis": {},
+        "implementation_plan": {},
+        "phase": "A",
+        "human_approved": False,
+        "execution_result": {},
+        "session_id": session_id,
+        "repo_profile": None,
+    }
@@ -9,7 +9,7 @@ CRITICAL: The BountyOrchestrator class follows the serialization protocol:
 - set_up: Initializes clients and graph (runs remotely after unpickle)
 
 Usage:
-    python deploy.py [--env prod|staging]
+    python deploy.py [--env prod|staging] [--force]
 
 Environment variables:
     GOOGLE_CLOUD_PROJECT: GCP project ID (default: intentional-bounty)
@@ -19,15 +19,81 @@ Environment variables:
 """
 
 import argparse
+import hashlib
 import os
 import sys
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).parent / "bounty_agent"
+
+# Tuples so the pins can't be changed in place; create() gets list copies
+# because the SDK may append its own requirements to what it is given.
+REQUIREMENTS = (
+    # Core framework
+    "langgraph>=1.0.0,<2.0.0",
+    "langchain>=1.0.0,<2.0.0",
+    "langchain-core>=0.3.0",
+    "langchain-google-vertexai>=3.2.1",
+    # CRITICAL: Serialization pins (must match exactly)
+    "cloudpickle==3.0.0",
+    "pydantic==2.7.4",
+    # Vertex AI SDK with Agent Engine support
+    "google-cloud-aiplatform[agent_engines,langchain,reasoningengine]>=1.112.0",
+    # Checkpointing
+    "langgraph-checkpoint-postgres>=2.0.0",
+    "psycopg[binary]>=3.1.0",
+    "psycopg-pool>=3.2.0",
+    # A2A communication
+    "httpx>=0.25.0",
+)
+
+EXTRA_PACKAGES = ("./bounty_agent",)
+
+DESCRIPTION = (
+    "LangGraph bounty workflow orchestrator - integrates with Bob's Brain via A2A"
+)
+
+
+def source_hash(*settings: str) -> str:
+    """Short SHA-256 of everything a deployment ships.
+
+    Covers the bounty_agent sources (sorted by path), the requirements
+    pins and the agent settings that get pickled, so any change that
+    would alter the deployed agent changes it.
+    """
+    digest = hashlib.sha256("\0".join(settings).encode())
+    for path in sorted(PACKAGE_DIR.rglob("*.py")):
+        digest.update(path.relative_to(PACKAGE_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    digest.update("\n".join(REQUIREMENTS).encode())
+    return digest.hexdigest()[:12]
+
+
+def find_current_deployment(reasoning_engines, display_name: str, tag: str):
+    """Return the existing deployment built from the same sources, if any."""
+    try:
+        engines = reasoning_engines.ReasoningEngine.list(
+            filter=f'display_name="{display_name}"'
+        )
+    except Exception as e:
+        print(f"  Could not list existing deployments ({e}); deploying")
+        return None
+    for engine in engines:
+        if tag in (engine.gca_resource.description or ""):
+            return engine
+    return None
 
 
-def deploy(env: str = "prod"):
+def deploy(env: str = "prod", force: bool = False):
     """Deploy the bounty orchestrator to Agent Engine.
 
+    Skips the upload and create when a deployment built from identical
+    sources already exists (matched by the source hash in its
+    description), unless force is set.
+
     Args:
         env: Deployment environment ('prod' or 'staging')
+        force: Deploy even if the sources are unchanged
     """
     # Lazy imports to avoid issues when just checking help
     import vertexai
@@ -39,11 +105,17 @@ def deploy(env: str = "prod"):
     location = os.environ.get("GOOGLE_CLOUD_REGION", "us-central1")
     staging_bucket = f"gs://{project_id}-staging"
 
+    model_name = "gemini-2.0-flash"
+    bobs_brain_url = os.environ.get("BOBS_BRAIN_A2A_URL")
+    display_name = f"bounty-orchestrator-{env}"
+    tag = f"[source {source_hash(model_name, str(bobs_brain_url))}]"
+
     print(f"Deploying bounty-orchestrator to Agent Engine")
     print(f"  Project: {project_id}")
     print(f"  Location: {location}")
     print(f"  Environment: {env}")
     print(f"  Staging bucket: {staging_bucket}")
+    print(f"  Source: {tag}")
     print()
 
     # Initialize Vertex AI
@@ -53,13 +125,21 @@ def deploy(env: str = "prod"):
         staging_bucket=staging_bucket,
     )
 
+    if not force:
+        current = find_current_deployment(reasoning_engines, display_name, tag)
+        if current is not None:
+            print("Sources unchanged since the last deployment; skipping.")
+            print(f"  Resource name: {current.resource_name}")
+            print("  (Use --force to deploy anyway)")
+            return current
+
     # Create agent instance (only primitives in __init__)
     # These values get pickled and sent to Agent Engine
     agent = BountyOrchestrator(
         project_id=project_id,
         location=location,
-        model_name="gemini-2.0-flash",
-        bobs_brain_url=os.environ.get("BOBS_BRAIN_A2A_URL"),
+        model_name=model_name,
+        bobs_brain_url=bobs_brain_url,
     )
 
     print("Creating Agent Engine deployment...")
@@ -71,31 +151,11 @@ def deploy(env: str = "prod"):
     try:
         remote_agent = reasoning_engines.ReasoningEngine.create(
             reasoning_engine=agent,
-            requirements=[
-                # Core framework
-                "langgraph>=1.0.0,<2.0.0",
-                "langchain>=1.0.0,<2.0.0",
-                "langchain-core>=0.3.0",
-                "langchain-google-vertexai>=3.2.1",
-
-                # CRITICAL: Serialization pins (must match exactly)
-                "cloudpickle==3.0.0",
-                "pydantic==2.7.4",
-
-                # Vertex AI SDK with Agent Engine support
-                "google-cloud-aiplatform[agent_engines,langchain,reasoningengine]>=1.112.0",
-
-                # Checkpointing
-                "langgraph-checkpoint-postgres>=2.0.0",
-                "psycopg[binary]>=3.1.0",
-
-                # A2A communication
-                "httpx>=0.25.0",
-            ],
-            display_name=f"bounty-orchestrator-{env}",
-            description="LangGraph bounty workflow orchestrator - integrates with Bob's Brain via A2A",
+            requirements=list(REQUIREMENTS),
+            display_name=display_name,
+            description=f"{DESCRIPTION} {tag}",
             sys_version="3.11",
-            extra_packages=["./bounty_agent"],
+            extra_packages=list(EXTRA_PACKAGES),
         )
 
         print()
@@ -140,9 +200,14 @@ def main():
         default="prod",
         help="Deployment environment (default: prod)",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Deploy even if the sources match the current deployment",
+    )
     args = parser.parse_args()
 
-    deploy(env=args.env)
+    deploy(env=args.env, force=args.force)
 
 
 if __name__ == "__main__":
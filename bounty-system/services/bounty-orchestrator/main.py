@@ -3,16 +3,46 @@
 
 Run with: python main.py
 Or with: uvicorn main:app --reload
+
+python main.py pins uvloop and httptools (both from uvicorn[standard]) so a
+missing extra fails at startup instead of silently falling back to the
+pure-Python loop and parser. WEB_CONCURRENCY sets the worker count. Keep it
+at 1 unless needed: the job queue, response caches and per-thread workflow
+locks are per-process, so scale out with more instances instead.
+
+Auto-reload is off unless UVICORN_RELOAD=1 (local development only): the
+reloader adds a supervisor process and file polling.
 """
 
-import uvicorn
+import os
+
+
+def __getattr__(name: str):
+    """Resolve ``app`` on first access so ``uvicorn main:app`` still works.
+
+    The parent ``python main.py`` process never touches it: uvicorn imports
+    the app by string in the process that serves it.
+    """
+    if name == "app":
+        from bounty_agent.api import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from bounty_agent.api import app
 
 if __name__ == "__main__":
+    # Imported here so importing main (tests, tooling) doesn't load uvicorn
+    import uvicorn
+
+    reload = os.environ.get("UVICORN_RELOAD") == "1"
     uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=8080,
-        reload=True,
+        "bounty_agent.api:app",
+        host=os.environ.get("HOST", "0.0.0.0"),
+        port=int(os.environ.get("PORT", "8080")),
+        loop="uvloop",
+        http="httptools",
+        reload=reload,
+        # The reloader runs a single worker
+        workers=None if reload else int(os.environ.get("WEB_CONCURRENCY", "1")),
+        backlog=2048,
     )
@@ -7,13 +7,54 @@ from unittest.mock import patch, AsyncMock, MagicMock
 fastapi = pytest.importorskip("fastapi", reason="fastapi not installed")
 from fastapi.testclient import TestClient
 
-from bounty_agent.api import app
+from bounty_agent.api import _app_graph, _app_memory, _jobs, app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create a test client."""
-    return TestClient(app)
+    """Create a test client with the app lifespan running.
+
+    Module-scoped so the lifespan runs once for these tests; tests that
+    change dependency overrides must undo them (see mock_graph).
+    """
+    with TestClient(app) as client:
+        yield client
+
+
+def _drain(client):
+    """Wait for the background jobs queued through client to finish."""
+    client.portal.call(_jobs.join)
+
+
+@pytest.fixture
+def mock_graph():
+    """Replace the lifespan-compiled graph with a mock."""
+    graph = MagicMock()
+    app.dependency_overrides[_app_graph] = lambda: graph
+    yield graph
+    app.dependency_overrides.pop(_app_graph, None)
+
+
+class TestLifespan:
+    """Tests for application startup."""
+
+    def test_lifespan_compiles_graph(self):
+        """Test that the graph is compiled before serving requests."""
+        from bounty_agent.local_graph import get_graph
+
+        with TestClient(app):
+            assert app.state.graph is get_graph()
+
+    def test_lifespan_creates_memory_manager(self):
+        """Test that one memory manager is created at startup and shared."""
+        from bounty_agent.memory import MemoryManager
+
+        with TestClient(app) as client:
+            memory = app.state.memory
+            client.get("/api/bounties")
+
+            assert isinstance(memory, MemoryManager)
+            assert app.state.memory is memory
 
 
 class TestHealthEndpoint:
@@ -26,31 +67,92 @@ class TestHealthEndpoint:
         data = response.json()
         assert data["status"] == "healthy"
         assert data["service"] == "bounty-orchestrator"
+        assert response.headers["cache-control"] == "no-store"
+
+    def test_health_check_sheds_load_when_backlogged(self, client):
+        """Test that health returns 503 while the job queue is full."""
+        with patch("bounty_agent.api._jobs.full", return_value=True):
+            response = client.get("/health")
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "overloaded"
 
 
 class TestStartBountyEndpoint:
     """Tests for the start bounty endpoint."""
 
-    def test_start_bounty_returns_session_info(self, client):
+    def test_start_bounty_returns_session_info(self, client, mock_graph):
         """Test that starting a bounty returns session info."""
-        with patch("bounty_agent.api.graph") as mock_graph:
-            mock_graph.ainvoke = AsyncMock(return_value={})
+        mock_graph.ainvoke = AsyncMock(return_value={})
 
-            response = client.post(
-                "/api/bounty/start",
-                json={
-                    "bounty_id": "test-123",
-                    "issue_url": "https://github.com/owner/repo/issues/1",
-                    "repo": "owner/repo",
-                },
-            )
+        response = client.post(
+            "/api/bounty/start",
+            json={
+                "bounty_id": "test-123",
+                "issue_url": "https://github.com/owner/repo/issues/1",
+                "repo": "owner/repo",
+            },
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "analyzing"
-            assert data["bounty_id"] == "test-123"
-            assert "session_id" in data
-            assert data["session_id"].startswith("bounty-test-123-")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "analyzing"
+        assert data["bounty_id"] == "test-123"
+        assert "session_id" in data
+        assert data["session_id"].startswith("bounty-test-123-")
+
+    def test_start_bounty_runs_workflow_in_background(self, client, mock_graph):
+        """Test that the workflow is invoked with the initial state."""
+        mock_graph.ainvoke = AsyncMock(side_effect=RuntimeError("boom"))
+
+        response = client.post(
+            "/api/bounty/start",
+            json={
+                "bounty_id": "test-456",
+                "issue_url": "https://github.com/owner/repo/issues/2",
+                "repo": "https://github.com/owner/repo",
+            },
+        )
+        _drain(client)
+
+        # A failing background run must not surface as a request error
+        assert response.status_code == 200
+        mock_graph.ainvoke.assert_awaited_once()
+        state, config = mock_graph.ainvoke.call_args[0]
+        assert state["bounty_id"] == "test-456"
+        assert state["phase"] == "A"
+        assert state["repo_id"] == "github_com_owner_repo"
+        assert len(state["session_id"]) == len("bounty-test-456-") + 8
+        assert config == {
+            "configurable": {"thread_id": "test-456"},
+            "recursion_limit": 50,
+        }
+
+    async def test_runs_for_one_thread_do_not_overlap(self):
+        """Test that duplicate runs on one thread execute one at a time."""
+        import asyncio
+
+        from bounty_agent.api import _run_workflow, _workflow_locks
+
+        active = []
+        overlaps = []
+
+        async def ainvoke(state, config):
+            overlaps.append(bool(active))
+            active.append(config)
+            await asyncio.sleep(0.01)
+            active.remove(config)
+
+        graph = MagicMock()
+        graph.ainvoke = ainvoke
+        config = {"configurable": {"thread_id": "dup-1"}}
+
+        await asyncio.gather(
+            _run_workflow(graph, {}, config), _run_workflow(graph, None, config)
+        )
+
+        assert overlaps == [False, False]
+        assert "dup-1" not in _workflow_locks
 
     def test_start_bounty_missing_fields(self, client):
         """Test that missing fields return validation error."""
@@ -65,7 +167,7 @@ class TestStartBountyEndpoint:
 class TestBountyStatusEndpoint:
     """Tests for the bounty status endpoint."""
 
-    def test_get_status_returns_current_state(self, client):
+    def test_get_status_returns_current_state(self, client, mock_graph):
         """Test that status endpoint returns current workflow state."""
         mock_state = MagicMock()
         mock_state.next = ["approval"]
@@ -75,17 +177,16 @@ class TestBountyStatusEndpoint:
             "human_approved": False,
         }
 
-        with patch("bounty_agent.api.graph") as mock_graph:
-            mock_graph.get_state.return_value = mock_state
+        mock_graph.aget_state = AsyncMock(return_value=mock_state)
 
-            response = client.get("/api/bounty/test-123/status")
+        response = client.get("/api/bounty/test-123/status")
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["current_node"] == "approval"
-            assert data["state"]["phase"] == "C"
+        assert response.status_code == 200
+        data = response.json()
+        assert data["current_node"] == "approval"
+        assert data["state"]["phase"] == "C"
 
-    def test_get_status_complete_workflow(self, client):
+    def test_get_status_complete_workflow(self, client, mock_graph):
         """Test status when workflow is complete."""
         mock_state = MagicMock()
         mock_state.next = []  # Empty means complete
@@ -96,35 +197,72 @@ class TestBountyStatusEndpoint:
             "execution_result": {"pr_url": "https://github.com/o/r/pull/1"},
         }
 
-        with patch("bounty_agent.api.graph") as mock_graph:
-            mock_graph.get_state.return_value = mock_state
+        mock_graph.aget_state = AsyncMock(return_value=mock_state)
 
-            response = client.get("/api/bounty/test-123/status")
+        response = client.get("/api/bounty/test-123/status")
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["current_node"] == "complete"
+        assert response.status_code == 200
+        data = response.json()
+        assert data["current_node"] == "complete"
 
 
 class TestApproveEndpoint:
     """Tests for the approve endpoint."""
 
-    def test_approve_updates_state(self, client):
+    def test_approve_updates_state(self, client, mock_graph):
         """Test that approve endpoint updates state and resumes workflow."""
-        with patch("bounty_agent.api.graph") as mock_graph:
-            mock_graph.update_state = MagicMock()
-            mock_graph.ainvoke = AsyncMock(return_value={})
+        mock_graph.aupdate_state = AsyncMock(
+            return_value={
+                "configurable": {"thread_id": "test-123", "checkpoint_id": "cp-1"}
+            }
+        )
+        mock_graph.ainvoke = AsyncMock(return_value={})
 
-            response = client.post("/api/bounty/test-123/approve")
+        response = client.post("/api/bounty/test-123/approve")
+        _drain(client)
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "executing"
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "executing"
+
+        # Verify state was updated
+        mock_graph.aupdate_state.assert_awaited_once()
+        call_args = mock_graph.aupdate_state.call_args
+        assert call_args[0][1] == {"human_approved": True, "phase": "D"}
+
+        # The resume uses the unpinned thread config with the recursion limit
+        mock_graph.ainvoke.assert_awaited_once_with(
+            None,
+            {"configurable": {"thread_id": "test-123"}, "recursion_limit": 50},
+        )
+
+    def test_repeated_approve_resumes_once(self, client, mock_graph):
+        """Test that a second approve while the run is going is dropped."""
+        import asyncio
+
+        async def slow_run(state, config):
+            await asyncio.sleep(0.1)
+
+        mock_graph.aupdate_state = AsyncMock(return_value={})
+        mock_graph.ainvoke = AsyncMock(side_effect=slow_run)
+
+        first = client.post("/api/bounty/test-123/approve")
+        second = client.post("/api/bounty/test-123/approve")
+        _drain(client)
+
+        assert first.status_code == second.status_code == 200
+        mock_graph.ainvoke.assert_awaited_once()
+
+    def test_reject_marks_bounty_rejected(self, client, mock_graph):
+        """Test that reject writes the rejected outcome asynchronously."""
+        mock_graph.aupdate_state = AsyncMock(return_value={})
 
-            # Verify state was updated
-            mock_graph.update_state.assert_called_once()
-            call_args = mock_graph.update_state.call_args
-            assert call_args[0][1] == {"human_approved": True, "phase": "D"}
+        response = client.post("/api/bounty/test-123/reject")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "rejected", "bounty_id": "test-123"}
+        mock_graph.aupdate_state.assert_awaited_once()
+        assert mock_graph.aupdate_state.call_args[0][1]["outcome"] == "rejected"
 
 
 class TestReposEndpoint:
@@ -138,6 +276,83 @@ class TestReposEndpoint:
         data = response.json()
         assert data == []
 
+    def test_list_repos_is_cached(self, client):
+        """Test that repeated polls inside the TTL hit the store once."""
+        from bounty_agent.api import _list_cache
+
+        _list_cache.invalidate()
+        memory = MagicMock()
+        memory.list_repos = AsyncMock(
+            return_value=[("owner_repo", {"url": "https://github.com/owner/repo"})]
+        )
+
+        with patch.dict(app.dependency_overrides, {_app_memory: lambda: memory}):
+            first = client.get("/api/repos")
+            second = client.get("/api/repos")
+
+            assert first.json() == second.json()
+            assert first.json()[0]["id"] == "owner_repo"
+            assert "max-age=" in first.headers["cache-control"]
+            memory.list_repos.assert_awaited_once()
+
+            # Invalidation forces the next poll back to the store
+            _list_cache.invalidate(("repos",))
+            client.get("/api/repos")
+            assert memory.list_repos.await_count == 2
+
+        _list_cache.invalidate()
+
+    def test_sync_repo_schedules_sync(self, client):
+        """Test that sync returns immediately and syncs in the background."""
+        with patch(
+            "bounty_agent.api.sync_repo_knowledge", new_callable=AsyncMock
+        ) as mock_sync:
+            response = client.post(
+                "/api/repos/sync", params={"repo_url": "https://github.com/o/r"}
+            )
+            _drain(client)
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": "syncing",
+            "repo_url": "https://github.com/o/r",
+        }
+        mock_sync.assert_awaited_once()
+
+    async def test_sync_repo_skips_fresh_profile(self, client):
+        """Test that a fresh profile is not re-synced unless forced."""
+        from datetime import datetime
+
+        from bounty_agent.memory import get_store
+
+        store = get_store()
+        await store.aput(
+            ("repos", "github_com_o_fresh"),
+            "profile",
+            {"last_synced": datetime.now().isoformat()},
+        )
+
+        try:
+            with patch(
+                "bounty_agent.api.sync_repo_knowledge", new_callable=AsyncMock
+            ) as mock_sync:
+                fresh = client.post(
+                    "/api/repos/sync",
+                    params={"repo_url": "https://github.com/o/fresh"},
+                )
+                forced = client.post(
+                    "/api/repos/sync",
+                    params={"repo_url": "https://github.com/o/fresh", "force": True},
+                )
+                _drain(client)
+        finally:
+            await store.adelete(("repos", "github_com_o_fresh"), "profile")
+
+        assert fresh.json()["status"] == "fresh"
+        assert forced.json()["status"] == "syncing"
+        # Only the forced request queued a sync
+        mock_sync.assert_awaited_once()
+
 
 class TestBountiesEndpoint:
     """Tests for the bounties listing endpoint."""
@@ -150,6 +365,97 @@ class TestBountiesEndpoint:
         data = response.json()
         assert data == []
 
+    async def test_list_bounties_reads_dev_store(self, client):
+        """Test that bounties written to the dev store are listed."""
+        from bounty_agent.api import _list_cache
+        from bounty_agent.memory import get_store, put_bounty_state
+
+        _list_cache.invalidate()
+        store = get_store()
+        await put_bounty_state(
+            store, "test-789", {"phase": "C", "repo_id": "o_r", "plan": "x" * 1000}
+        )
+
+        try:
+            response = client.get("/api/bounties")
+
+            assert response.status_code == 200
+            assert response.json() == [
+                {
+                    "id": "test-789",
+                    "issue_summary": "",
+                    "phase": "C",
+                    "repo_id": "o_r",
+                }
+            ]
+        finally:
+            await store.adelete(("bounties", "test-789"), "state")
+            await store.adelete(("bounty_index",), "test-789")
+            _list_cache.invalidate()
+
+    async def test_get_bounty_detail_returns_full_state(self, client):
+        """Test that the detail endpoint returns the stored state as JSON."""
+        from bounty_agent.memory import get_store, put_bounty_state
+
+        store = get_store()
+        state = {"phase": "C", "implementation_plan": {"steps": ["a", "b"]}}
+        await put_bounty_state(store, "detail-1", state)
+
+        try:
+            response = client.get("/api/bounties/detail-1")
+            missing = client.get("/api/bounties/nope")
+        finally:
+            await store.adelete(("bounties", "detail-1"), "state")
+            await store.adelete(("bounty_index",), "detail-1")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == state
+        assert missing.status_code == 404
+
+    async def test_get_bounty_detail_streams_large_state(self, client):
+        """Test that a large state is streamed and still decodes intact."""
+        from bounty_agent.api import STREAM_THRESHOLD
+        from bounty_agent.memory import get_store, put_bounty_state
+
+        store = get_store()
+        state = {
+            "phase": "C",
+            "implementation_plan": {"notes": "x" * STREAM_THRESHOLD},
+            "competition_analysis": {"competing_prs": 0},
+        }
+        await put_bounty_state(store, "detail-big", state)
+
+        try:
+            response = client.get("/api/bounties/detail-big")
+        finally:
+            await store.adelete(("bounties", "detail-big"), "state")
+            await store.adelete(("bounty_index",), "detail-big")
+
+        assert response.status_code == 200
+        assert "content-length" not in response.headers
+        assert response.json() == state
+
+    async def test_backfill_indexes_lists_existing_bounties(self, client):
+        """Test that bounties saved before the index existed get listed."""
+        from bounty_agent.api import _list_cache
+        from bounty_agent.memory import MemoryManager, get_store
+
+        _list_cache.invalidate()
+        store = get_store()
+        await store.aput(("bounties", "legacy-1"), "state", {"phase": "F"})
+
+        try:
+            await MemoryManager(store).backfill_indexes()
+            response = client.get("/api/bounties")
+
+            assert [b["id"] for b in response.json()] == ["legacy-1"]
+            assert response.json()[0]["phase"] == "F"
+        finally:
+            await store.adelete(("bounties", "legacy-1"), "state")
+            await store.adelete(("bounty_index",), "legacy-1")
+            _list_cache.invalidate()
+
 
 class TestLearningsEndpoint:
     """Tests for the learnings search endpoint."""
@@ -1,9 +1,11 @@
 """Tests for Bob's Brain A2A client."""
 
 import os
-import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
+import pytest
+
 from bounty_agent.bobs_brain_client import BobsBrainClient, bob
 
 
@@ -41,8 +43,6 @@ class TestBobsBrainClient:
             with patch("httpx.AsyncClient") as mock_client_class:
                 mock_client = AsyncMock()
                 mock_client.post.return_value = mock_response
-                mock_client.__aenter__.return_value = mock_client
-                mock_client.__aexit__.return_value = None
                 mock_client_class.return_value = mock_client
 
                 result = await client.ask_bob(
@@ -55,12 +55,16 @@ class TestBobsBrainClient:
                 mock_client.post.assert_called_once()
                 call_args = mock_client.post.call_args
 
-                assert call_args[0][0] == f"{test_url}/a2a/run"
-                assert call_args[1]["json"]["agent_role"] == "bob"
-                assert call_args[1]["json"]["prompt"] == "Test prompt"
-                assert call_args[1]["json"]["context"] == {"key": "value"}
-                assert call_args[1]["json"]["session_id"] == "test-session"
-                assert call_args[1]["timeout"] == 120.0
+                body = orjson.loads(call_args[1]["content"])
+                assert call_args[0][0] == "/a2a/run"
+                assert body["agent_role"] == "bob"
+                assert body["prompt"] == "Test prompt"
+                assert body["context"] == {"key": "value"}
+                assert body["session_id"] == "test-session"
+
+                client_kwargs = mock_client_class.call_args[1]
+                assert client_kwargs["base_url"] == test_url
+                assert client_kwargs["timeout"].read == 120.0
 
                 assert result == {"response": {"status": "ok"}}
 
@@ -79,15 +83,34 @@ class TestBobsBrainClient:
             with patch("httpx.AsyncClient") as mock_client_class:
                 mock_client = AsyncMock()
                 mock_client.post.return_value = mock_response
-                mock_client.__aenter__.return_value = mock_client
-                mock_client.__aexit__.return_value = None
                 mock_client_class.return_value = mock_client
 
                 await client.ask_bob(prompt="Test prompt")
 
-                call_args = mock_client.post.call_args
-                assert call_args[1]["json"]["context"] == {}
-                assert call_args[1]["json"]["session_id"] is None
+                body = orjson.loads(mock_client.post.call_args[1]["content"])
+                assert body["context"] == {}
+                assert body["session_id"] is None
+
+    @pytest.mark.asyncio
+    async def test_ask_bob_reuses_client(self):
+        """Test that repeated calls share one pooled HTTP client."""
+        client = BobsBrainClient(base_url="https://test-a2a-gateway.run.app")
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"response": {}}
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.post.return_value = mock_response
+            mock_client_class.return_value = mock_client
+
+            await client.ask_bob(prompt="one")
+            await client.ask_bob(prompt="two")
+            await client.aclose()
+
+            mock_client_class.assert_called_once()
+            assert mock_client.post.await_count == 2
+            mock_client.aclose.assert_awaited_once()
 
 
 class TestGlobalBobInstance:
@@ -0,0 +1,50 @@
+"""Tests for the in-process TTL cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from bounty_agent.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    async def test_concurrent_misses_share_one_load(self):
+        """Test that simultaneous misses for one key load once."""
+        cache = TTLCache(ttl=60)
+        loader = AsyncMock(return_value="value")
+
+        results = await asyncio.gather(
+            *(cache.get_or_load(("k",), loader) for _ in range(5))
+        )
+
+        assert results == ["value"] * 5
+        loader.assert_awaited_once()
+
+    async def test_stale_value_served_while_refreshing(self):
+        """Test that an expired entry is returned while it reloads."""
+        cache = TTLCache(ttl=10, stale_ttl=30)
+        cache.set(("k",), "old")
+        loader = AsyncMock(return_value="new")
+
+        fresh_until, _ = cache._data[("k",)]
+        with patch("bounty_agent.cache.time.monotonic", return_value=fresh_until + 5):
+            assert await cache.get_or_load(("k",), loader) == "old"
+
+            # Let the background refresh and its done-callback run
+            await cache._inflight[("k",)]
+            await asyncio.sleep(0)
+            assert cache._data[("k",)][1] == "new"
+
+        loader.assert_awaited_once()
+
+    async def test_invalidate_prefix(self):
+        """Test that invalidation drops only keys under the prefix."""
+        cache = TTLCache(ttl=60)
+        cache.set(("learnings", "rejections", 20), b"[]")
+        cache.set(("learnings", "successes", 20), b"[]")
+        cache.set(("repos",), b"[]")
+
+        cache.invalidate(("learnings",))
+
+        assert list(cache._data) == [("repos",)]
@@ -0,0 +1,80 @@
+"""Tests for the in-process job queue."""
+
+import asyncio
+
+import pytest
+
+from bounty_agent.jobs import JobQueue, JobQueueFullError
+
+
+class TestJobQueue:
+    """Tests for JobQueue."""
+
+    async def test_runs_jobs_and_drains_on_stop(self):
+        """Test that queued jobs run before stop returns."""
+        jobs = JobQueue(workers=2, maxsize=10)
+        jobs.start()
+        done = []
+
+        async def job(n):
+            await asyncio.sleep(0)
+            done.append(n)
+
+        for n in range(3):
+            jobs.enqueue(job, n)
+        await jobs.stop(timeout=5)
+
+        assert sorted(done) == [0, 1, 2]
+        assert not jobs.started
+
+    async def test_join_waits_without_stopping(self):
+        """Test that join waits for queued jobs and leaves workers running."""
+        jobs = JobQueue(workers=1, maxsize=10)
+        jobs.start()
+        done = []
+
+        async def job():
+            await asyncio.sleep(0)
+            done.append(True)
+
+        jobs.enqueue(job)
+        await jobs.join()
+
+        assert done == [True]
+        assert jobs.started
+        await jobs.stop(timeout=5)
+
+    async def test_duplicate_job_id_is_skipped(self):
+        """Test that a job id already queued is not queued again."""
+        jobs = JobQueue(workers=1, maxsize=10)
+        jobs.start()
+        gate = asyncio.Event()
+
+        async def job():
+            await gate.wait()
+
+        assert jobs.enqueue(job, job_id="sync:o/r") is True
+        assert jobs.enqueue(job, job_id="sync:o/r") is False
+
+        gate.set()
+        await jobs.stop(timeout=5)
+
+    async def test_full_queue_raises(self):
+        """Test that enqueueing past capacity raises JobQueueFullError."""
+        jobs = JobQueue(workers=1, maxsize=1)
+        jobs.start()
+        gate = asyncio.Event()
+
+        async def job():
+            await gate.wait()
+
+        jobs.enqueue(job)
+        await asyncio.sleep(0)  # worker takes the first job
+        jobs.enqueue(job)
+
+        with pytest.raises(JobQueueFullError):
+            jobs.enqueue(job)
+        assert jobs.full()
+
+        gate.set()
+        await jobs.stop(timeout=5)
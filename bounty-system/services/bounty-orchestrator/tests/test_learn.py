@@ -0,0 +1,68 @@
+"""Tests for recording submission outcomes."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest.importorskip("langgraph", reason="langgraph not installed")
+
+from langgraph.store.memory import InMemoryStore
+
+from bounty_agent.bobs_brain_client import bob
+from bounty_agent.knowledge import record_submission_outcome
+from bounty_agent.memory import put_bounty_state, put_repo_profile
+
+
+class TestRecordSubmissionOutcome:
+    """Tests for record_submission_outcome."""
+
+    async def test_rejection_records_lesson_and_gotcha(self):
+        """Test that a rejection stores the lesson, gotcha and outcome."""
+        store = InMemoryStore()
+        await put_bounty_state(store, "b1", {"repo": "o/r", "repo_id": "o_r"})
+        await put_repo_profile(store, "o_r", {"gotchas": []})
+        ask_bob = AsyncMock(return_value={"response": "Run the linter"})
+
+        with patch.object(bob, "ask_bob", ask_bob):
+            await record_submission_outcome("b1", "rejected", "lint fails", store)
+
+        bounty = (await store.aget(("bounties", "b1"), "state")).value
+        profile = (await store.aget(("repos", "o_r"), "profile")).value
+        learnings = await store.asearch(("learnings", "rejections"))
+
+        assert bounty["outcome"] == "rejected"
+        assert bounty["phase"] == "F"
+        assert profile["gotchas"] == ["Run the linter"]
+        assert [item.value["lesson"] for item in learnings] == ["Run the linter"]
+        ask_bob.assert_awaited_once()
+
+    async def test_merge_records_success(self):
+        """Test that a merge stores a success without asking Bob."""
+        store = InMemoryStore()
+        await put_bounty_state(store, "b2", {"repo": "o/r"})
+        ask_bob = AsyncMock()
+
+        with patch.object(bob, "ask_bob", ask_bob):
+            await record_submission_outcome("b2", "merged", None, store)
+
+        successes = await store.asearch(("learnings", "successes"))
+        index = await store.aget(("bounty_index",), "b2")
+
+        assert len(successes) == 1
+        assert index.value["outcome"] == "merged"
+        ask_bob.assert_not_awaited()
+
+    async def test_failed_lookup_creates_no_writes(self):
+        """Test that no write coroutine is left unawaited when Bob fails."""
+        store = InMemoryStore()
+        await put_bounty_state(store, "b3", {"repo": "o/r"})
+        put_state = MagicMock()
+
+        with (
+            patch.object(bob, "ask_bob", AsyncMock(side_effect=RuntimeError)),
+            patch("bounty_agent.knowledge.learn.put_bounty_state", put_state),
+            pytest.raises(RuntimeError),
+        ):
+            await record_submission_outcome("b3", "rejected", "lint fails", store)
+
+        put_state.assert_not_called()
@@ -0,0 +1,46 @@
+"""Tests for prompt templates."""
+
+import pytest
+
+from bounty_agent.prompts import (
+    ANALYZE_PROMPT,
+    IMPLEMENT_PROMPT,
+    REJECTION_LESSON_PROMPT,
+    REPO_SYNC_PROMPT,
+    PromptTemplate,
+)
+
+
+class TestPromptTemplate:
+    """Tests for PromptTemplate."""
+
+    @pytest.mark.parametrize(
+        "prompt",
+        [ANALYZE_PROMPT, IMPLEMENT_PROMPT, REJECTION_LESSON_PROMPT, REPO_SYNC_PROMPT],
+    )
+    def test_renders_like_str_format(self, prompt):
+        """Test that rendering matches str.format on the raw template."""
+        values = {
+            "issue_url": "https://github.com/o/r/issues/1",
+            "repo": "o/r",
+            "repo_url": "https://github.com/o/r",
+            "guidelines": "",
+            "plan": {"steps": ["fix"]},
+            "style_rules": {},
+            "lint_command": "ruff check .",
+            "test_command": "pytest",
+            "gotchas": "None",
+            "reviewer_feedback": "needs tests",
+        }
+
+        assert prompt.format(**values) == prompt.template.format(**values)
+
+    def test_missing_field_raises(self):
+        """Test that a missing value raises KeyError like str.format."""
+        with pytest.raises(KeyError):
+            PromptTemplate("Repo: {repo}").format()
+
+    def test_rejects_format_spec(self):
+        """Test that unsupported field syntax fails at construction."""
+        with pytest.raises(ValueError):
+            PromptTemplate("Score: {score:.2f}")
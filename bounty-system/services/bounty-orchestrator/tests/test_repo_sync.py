@@ -0,0 +1,38 @@
+"""Tests for repository knowledge sync."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+pytest.importorskip("langgraph", reason="langgraph not installed")
+
+from langgraph.store.memory import InMemoryStore
+
+from bounty_agent.bobs_brain_client import bob
+from bounty_agent.knowledge import get_repo_profile, sync_repo_knowledge
+
+
+class TestSyncRepoKnowledge:
+    """Tests for sync_repo_knowledge."""
+
+    async def test_concurrent_syncs_share_one_analysis(self):
+        """Test that simultaneous syncs of one repo ask Bob once."""
+        store = InMemoryStore()
+
+        async def slow_answer(**kwargs):
+            await asyncio.sleep(0.01)
+            return {"response": {"quick_summary": ["x"]}}
+
+        ask_bob = AsyncMock(side_effect=slow_answer)
+
+        with patch.object(bob, "ask_bob", ask_bob):
+            ids = await asyncio.gather(
+                sync_repo_knowledge("https://github.com/o/r", store, force=True),
+                sync_repo_knowledge("github.com/o/r", store, force=True),
+            )
+
+        assert ids == ["github_com_o_r", "github_com_o_r"]
+        ask_bob.assert_awaited_once()
+        profile = await get_repo_profile("github_com_o_r", store)
+        assert profile["quick_summary"] == ["x"]
@@ -2,7 +2,7 @@
 
 import pytest
 
-from bounty_agent.state import BountyState
+from bounty_agent.state import BountyState, new_bounty_state
 
 
 def test_bounty_state_required_fields():
@@ -70,3 +70,23 @@ def test_bounty_state_phases():
             "repo_profile": None,
         }
         assert state["phase"] == phase
+
+
+def test_new_bounty_state_defaults():
+    """Test that new_bounty_state fills every field with phase A defaults."""
+    state = new_bounty_state(
+        bounty_id="test-123",
+        issue_url="https://github.com/owner/repo/issues/1",
+        repo="owner/repo",
+        repo_id="github_com_owner_repo",
+        session_id="session-abc",
+    )
+
+    assert set(state) == set(BountyState.__annotations__)
+    assert state["phase"] == "A"
+    assert state["human_approved"] is False
+    assert state["repo_profile"] is None
+
+    # Mutable fields must not be shared between runs
+    other = new_bounty_state("b", "u", "r", "rid", "s")
+    assert state["issue_details"] is not other["issue_details"]
@@ -6,54 +6,151 @@ Usage: python3 tools/sync-airtable.py
 
 Requires AIRTABLE_PAT in .env or environment.
 Works locally and in GitHub Actions.
+
+A run is skipped when neither the CSV nor the table changed since the last
+successful sync (tracked in tools/.sync-airtable-state.json; delete it to
+force a full sync).
 """
 
 import csv
+import hashlib
 import json
 import os
 import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Determine repo root (works in CI and locally)
 SCRIPT_DIR = Path(__file__).parent.resolve()
 REPO_ROOT = SCRIPT_DIR.parent
 
-# Load token from .env if not in environment (local dev)
+# Load token from .env if not in environment (local dev). CI passes it as a
+# secret and has no .env, so the file is only read when the token is missing.
 if not os.environ.get('AIRTABLE_PAT'):
     env_path = REPO_ROOT / '.env'
     if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                if line.startswith('AIRTABLE_PAT='):
-                    os.environ['AIRTABLE_PAT'] = line.split('=', 1)[1].strip()
+        env = dict(
+            line.split('=', 1) for line in env_path.read_text().splitlines()
+            if '=' in line and not line.startswith('#')
+        )
+        if env.get('AIRTABLE_PAT'):
+            os.environ['AIRTABLE_PAT'] = env['AIRTABLE_PAT'].strip()
 
 # Config
 BASE_ID = "appmYMfPcb9lQ7MrF"
 TABLE_ID = "tblmEZqioueV9Pd9h"
 TOKEN = os.environ.get('AIRTABLE_PAT')
 CSV_PATH = REPO_ROOT / '000-docs/002-PM-BKLG-bounty-tracker.csv'
+TABLE_URL = f"https://api.airtable.com/v0/{BASE_ID}/{TABLE_ID}"
+STATE_PATH = SCRIPT_DIR / '.sync-airtable-state.json'
+LAST_MODIFIED_FIELD = 'Last Modified'
+
+# Airtable takes at most 10 records per write and 5 requests/s per base
+BATCH_SIZE = 10
+MAX_WORKERS = 5
+MIN_REQUEST_INTERVAL = 1 / 5
+
+# Every field csv_to_record can set; listing only fetches these
+SYNCED_FIELDS = ('Repo', 'Task', 'Bounty', 'Notes', 'Issue', 'PR', 'Lines',
+                 'Status', 'Competition', 'Started', 'Completed')
+
+# Select options in the Status / Competition fields; CSV values are
+# passed through unchanged and anything else is left unset
+STATUS_VALUES = frozenset({'Available', 'In Progress', 'Submitted', 'Draft',
+                           'MERGED', 'CLOSED'})
+COMPETITION_VALUES = frozenset({'NONE', 'LOW', 'MEDIUM', 'HIGH'})
+
+# CSV column -> Airtable number field
+INTEGER_COLUMNS = (('issue', 'Issue'), ('pr_number', 'PR'), ('lines', 'Lines'))
 
 if not TOKEN:
     print("Error: AIRTABLE_PAT not found in .env or environment")
     exit(1)
 
-headers = {
-    "Authorization": f"Bearer {TOKEN}",
-    "Content-Type": "application/json"
-}
+class WriteRetry(Retry):
+    """Retry that also re-sends creates (POST) rejected with 429.
+
+    Airtable doesn't process a rate-limited request, so resending it is
+    safe. POST stays out of allowed_methods otherwise: after a 5xx or a
+    read timeout the records may already exist, and a retry would
+    duplicate them.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if status_code == 429 and method.upper() == 'POST':
+            return bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
+
+# One keep-alive session for every call, so the TCP + TLS handshake to
+# api.airtable.com happens once per run instead of once per request. The
+# session already sends Accept-Encoding: gzip, deflate, and json= bodies set
+# their own Content-Type, so only the token needs adding.
+SESSION = requests.Session()
+SESSION.headers["Authorization"] = f"Bearer {TOKEN}"
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=10,
+    # Exponential backoff (0.5s, 1s, 2s, ...) unless the response sends
+    # Retry-After. PATCH sets absolute values, so it is safe to repeat.
+    # raise_on_status=False hands the last response back to the caller
+    # once retries run out, so the error is printed as before.
+    max_retries=WriteRetry(
+        total=8,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {'PATCH'},
+        raise_on_status=False,
+    ),
+))
+
+_throttle_lock = threading.Lock()
+_next_request_at = 0.0
+
+def throttle():
+    """Space request starts MIN_REQUEST_INTERVAL apart across all threads."""
+    global _next_request_at
+    with _throttle_lock:
+        now = time.monotonic()
+        wait = _next_request_at - now
+        _next_request_at = max(now, _next_request_at) + MIN_REQUEST_INTERVAL
+    if wait > 0:
+        time.sleep(wait)
+
+def write_batches(method, records):
+    """Send records in BATCH_SIZE chunks, MAX_WORKERS requests in flight.
+
+    Returns the responses in batch order.
+    """
+    def send(batch):
+        throttle()
+        return SESSION.request(method, TABLE_URL, json={"records": batch}, timeout=30)
+
+    batches = [records[i:i+BATCH_SIZE] for i in range(0, len(records), BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        return list(ex.map(send, batches))
 
 def get_existing_records():
-    """Fetch all existing records from Airtable."""
-    url = f"https://api.airtable.com/v0/{BASE_ID}/{TABLE_ID}"
+    """Fetch all existing records from Airtable.
+
+    Pages are fetched one after another: each request needs the offset
+    returned by the previous page, so they can't be issued ahead of time.
+    """
     records = []
     offset = None
 
     while True:
-        params = {}
+        # 100 is Airtable's maximum page size; ask for it explicitly so the
+        # number of round-trips doesn't depend on the API default. fields[]
+        # leaves out any columns the sync never compares.
+        params = [('pageSize', 100)] + [('fields[]', f) for f in SYNCED_FIELDS]
         if offset:
-            params['offset'] = offset
+            params.append(('offset', offset))
 
-        response = requests.get(url, headers=headers, params=params)
+        response = SESSION.get(TABLE_URL, params=params, timeout=30)
         data = response.json()
         records.extend(data.get('records', []))
 
@@ -63,6 +160,31 @@ def get_existing_records():
 
     return records
 
+def table_last_modified():
+    """Most recent LAST_MODIFIED_FIELD value in the table, or None.
+
+    One single-record request; None if the field is missing or the request
+    fails, in which case the caller can't assume the table is unchanged.
+    """
+    params = {
+        'maxRecords': 1,
+        'sort[0][field]': LAST_MODIFIED_FIELD,
+        'sort[0][direction]': 'desc',
+        'fields[]': LAST_MODIFIED_FIELD,
+    }
+    response = SESSION.get(TABLE_URL, params=params, timeout=30)
+    if response.status_code != 200:
+        return None
+    records = response.json().get('records', [])
+    return records[0]['fields'].get(LAST_MODIFIED_FIELD) if records else None
+
+def load_sync_state():
+    """State saved by the last successful sync, or {} if there is none."""
+    try:
+        return json.loads(STATE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
 def csv_to_record(row):
     """Convert CSV row to Airtable record fields."""
     fields = {
@@ -72,20 +194,18 @@ def csv_to_record(row):
         "Notes": row['notes'],
     }
 
-    if row['issue']:
-        fields["Issue"] = int(row['issue'])
-    if row['pr_number']:
-        fields["PR"] = int(row['pr_number'])
-    if row['lines']:
-        fields["Lines"] = int(row['lines'])
+    for column, field in INTEGER_COLUMNS:
+        value = row[column]
+        if value.isdecimal():
+            fields[field] = int(value)
+        elif value:
+            print(f"Warning: skipping non-integer {column} {value!r} "
+                  f"for {row['repo']} / {row['task']}")
 
-    status_map = {'Available': 'Available', 'In Progress': 'In Progress',
-                  'Submitted': 'Submitted', 'Draft': 'Draft',
-                  'MERGED': 'MERGED', 'CLOSED': 'CLOSED'}
-    if row['status'] in status_map:
-        fields["Status"] = status_map[row['status']]
+    if row['status'] in STATUS_VALUES:
+        fields["Status"] = row['status']
 
-    if row['competition'] in ['NONE', 'LOW', 'MEDIUM', 'HIGH']:
+    if row['competition'] in COMPETITION_VALUES:
         fields["Competition"] = row['competition']
 
     if row['date_started']:
@@ -97,13 +217,21 @@ def csv_to_record(row):
 
 def record_key(fields):
     """Create unique key for a record (repo + task)."""
-    return f"{fields.get('Repo', '')}|{fields.get('Task', '')}"
+    return (fields.get('Repo', ''), fields.get('Task', ''))
 
 def sync():
     """Sync CSV to Airtable."""
+    csv_hash = hashlib.sha256(CSV_PATH.read_bytes()).hexdigest()
+    state = load_sync_state()
+    if state.get('csv_sha256') == csv_hash:
+        last_modified = table_last_modified()
+        if last_modified is not None and last_modified == state.get('last_modified'):
+            print("✓ CSV and Airtable unchanged since the last sync; nothing to do")
+            return
+
     print("Fetching existing Airtable records...")
     existing = get_existing_records()
-    existing_map = {record_key(r['fields']): r for r in existing}
+    existing_map = {record_key(r['fields']): (r['id'], r['fields']) for r in existing}
     print(f"Found {len(existing)} existing records")
 
     print(f"Reading CSV from {CSV_PATH}...")
@@ -121,33 +249,44 @@ def sync():
     for fields in csv_records:
         key = record_key(fields)
         if key in existing_map:
-            record = existing_map[key]
-            # Check if needs update
-            if fields != {k: v for k, v in record['fields'].items() if k in fields}:
-                to_update.append({"id": record['id'], "fields": fields})
+            record_id, record_fields = existing_map[key]
+            # PATCH merges, so only send the fields that differ (CSV values
+            # are never None, so a field missing from Airtable is included)
+            delta = {k: v for k, v in fields.items() if record_fields.get(k) != v}
+            if delta:
+                to_update.append({"id": record_id, "fields": delta})
         else:
             to_create.append({"fields": fields})
 
-    url = f"https://api.airtable.com/v0/{BASE_ID}/{TABLE_ID}"
+    failed = False
 
     # Create new records
     if to_create:
         print(f"Creating {len(to_create)} new records...")
-        for i in range(0, len(to_create), 10):
-            batch = to_create[i:i+10]
-            response = requests.post(url, headers=headers, json={"records": batch})
+        for response in write_batches("POST", to_create):
             if response.status_code != 200:
+                failed = True
                 print(f"Error creating: {response.text}")
 
     # Update existing records
     if to_update:
         print(f"Updating {len(to_update)} records...")
-        for i in range(0, len(to_update), 10):
-            batch = to_update[i:i+10]
-            response = requests.patch(url, headers=headers, json={"records": batch})
+        for response in write_batches("PATCH", to_update):
             if response.status_code != 200:
+                failed = True
                 print(f"Error updating: {response.text}")
 
+    # Read the timestamp after our own writes so they don't count as changes
+    if not failed:
+        STATE_PATH.write_text(json.dumps({
+            'csv_sha256': csv_hash,
+            'last_modified': table_last_modified(),
+        }))
+
+    if failed:
+        print("\n✗ Sync finished with errors (see above)")
+        exit(1)
+
     print(f"\n✓ Sync complete: {len(to_create)} created, {len(to_update)} updated")
 
 if __name__ == '__main__':